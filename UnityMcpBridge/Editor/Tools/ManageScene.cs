@@ -24,7 +24,7 @@ namespace UnityMcpBridge.Editor.Tools
             "open", "create", "save", "save_as", "add_to_build", "get_scene_info", "get_open_scenes", 
             "close", "instantiate", "delete", "move", "rotate", "scale", "find", "get_component", 
             "set_component", "add_component", "remove_component", "get_position", "get_rotation", 
-            "get_scale", "set_parent", "set_active", "capture_screenshot"
+            "get_scale", "set_parent", "set_active", "capture_screenshot", "batch"
         };
 
         static ManageScene()
@@ -191,6 +191,9 @@ namespace UnityMcpBridge.Editor.Tools
                             return Response.Error("Screenshot path is required for capture_screenshot operation.");
                         return CaptureScreenshot(screenshotPath);
 
+                    case "batch":
+                        return ExecuteBatch(@params["operations"] as JArray);
+
                     default:
                         return Response.Error($"Scene action '{action}' is recognized but not yet implemented.");
                 }
@@ -202,6 +205,49 @@ namespace UnityMcpBridge.Editor.Tools
             }
         }
 
+        /// <summary>
+        /// Executes several scene operations sent in a single command, in order.
+        /// Stops at the first operation that fails, since later operations usually
+        /// depend on earlier ones (e.g. a save after an open), and returns an error
+        /// carrying the results of the operations run so far.
+        /// </summary>
+        private static object ExecuteBatch(JArray operations)
+        {
+            if (operations == null || operations.Count == 0)
+                return Response.Error("Operations list is required for batch operation.");
+
+            var results = new List<object>(operations.Count);
+            for (int i = 0; i < operations.Count; i++)
+            {
+                object result;
+                if (!(operations[i] is JObject operationParams))
+                {
+                    result = Response.Error("Batch operation must be an object.");
+                }
+                else if (string.Equals(operationParams["action"]?.ToString(), "batch", StringComparison.OrdinalIgnoreCase))
+                {
+                    result = Response.Error("Batch operations cannot be nested.");
+                }
+                else
+                {
+                    result = HandleCommand(operationParams);
+                }
+
+                results.Add(result);
+
+                JObject resultJson = JObject.FromObject(result);
+                if (resultJson.Value<bool?>("success") == false)
+                {
+                    return Response.Error(
+                        $"Batch stopped at operation {i + 1} of {operations.Count}: {resultJson["error"]}",
+                        new { results, failedIndex = i }
+                    );
+                }
+            }
+
+            return Response.Success($"Executed {results.Count} scene operations.", new { results });
+        }
+
         private static object CreateScene(string scenePath, string sceneName, bool? addToBuild)
         {
             try
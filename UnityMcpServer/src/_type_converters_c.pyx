@@ -0,0 +1,95 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Optional compiled fast paths for the hot converters in type_converters.
+
+Each function converts the common case (a plain dict, list or tuple holding
+int/float components) directly and returns None for anything else, in which
+case type_converters falls back to its pure Python converter, which also
+produces all validation errors.
+
+Build in place with:
+
+    cythonize -i _type_converters_c.pyx
+"""
+
+from cpython.dict cimport PyDict_GetItem
+from cpython.object cimport PyObject
+
+
+cdef inline bint _as_double(object v, double* out):
+    """Store v as a double if it is an exact int or float."""
+    if type(v) is float:
+        out[0] = <double>v
+        return True
+    if type(v) is int:
+        try:
+            out[0] = <double>v
+        except OverflowError:
+            return False
+        return True
+    return False
+
+
+cdef inline bint _dict_floats(dict d, tuple keys):
+    """Return True if d holds exactly the given keys, all with float values."""
+    cdef PyObject* item
+    if len(d) != len(keys):
+        return False
+    for key in keys:
+        item = PyDict_GetItem(d, key)
+        if item is NULL or type(<object>item) is not float:
+            return False
+    return True
+
+
+cdef inline bint _dict_double(dict d, str key, double* out):
+    """Store d[key] as a double if present and an exact int or float."""
+    cdef PyObject* item = PyDict_GetItem(d, key)
+    if item is NULL:
+        return False
+    return _as_double(<object>item, out)
+
+
+def vector3(value):
+    """Convert a Vector3 fast path; returns None if the value needs the full converter."""
+    cdef double x, y, z
+    cdef type t = type(value)
+    cdef dict d
+    if t is dict:
+        d = <dict>value
+        # Already canonical, same as the Python converter
+        if _dict_floats(d, ("x", "y", "z")):
+            return d
+        if (_dict_double(d, "x", &x) and _dict_double(d, "y", &y)
+                and _dict_double(d, "z", &z)):
+            return {"x": x, "y": y, "z": z}
+        return None
+    if t is list or t is tuple:
+        if len(value) != 3:
+            return None
+        if (_as_double(value[0], &x) and _as_double(value[1], &y)
+                and _as_double(value[2], &z)):
+            return {"x": x, "y": y, "z": z}
+    return None
+
+
+def quaternion(value):
+    """Convert a Quaternion fast path; returns None if the value needs the full converter."""
+    cdef double x, y, z, w
+    cdef type t = type(value)
+    cdef dict d
+    if t is dict:
+        d = <dict>value
+        if _dict_floats(d, ("x", "y", "z", "w")):
+            return d
+        if (_dict_double(d, "x", &x) and _dict_double(d, "y", &y)
+                and _dict_double(d, "z", &z) and _dict_double(d, "w", &w)):
+            return {"x": x, "y": y, "z": z, "w": w}
+        return None
+    if t is list or t is tuple:
+        if len(value) != 4:
+            return None
+        if (_as_double(value[0], &x) and _as_double(value[1], &y)
+                and _as_double(value[2], &z) and _as_double(value[3], &w)):
+            return {"x": x, "y": y, "z": z, "w": w}
+    return None
@@ -8,6 +8,7 @@ object hierarchies, and work with the various metadata included in serialized ob
 
 from typing import Dict, Any, List, Optional, Union, Tuple, Set, Iterator, TypeVar
 import copy
+import logging
 from type_converters import (
     is_serialized_unity_object, extract_type_info, get_unity_components,
     get_unity_children, find_component_by_type, is_circular_reference, 
@@ -20,6 +21,8 @@ from type_converters import (
     SERIALIZATION_DEPTH_BASIC, SERIALIZATION_DEPTH_STANDARD, SERIALIZATION_DEPTH_DEEP
 )
 
+logger = logging.getLogger(__name__)
+
 # Type alias for serialized objects
 SerializedObject = Dict[str, Any]
 T = TypeVar('T')
@@ -97,55 +100,33 @@ def get_gameobject_components_by_type(gameobject: SerializedObject, component_ty
     Returns:
         List of matching component objects
     """
-    import logging
-    logger = logging.getLogger(__name__)
-    
-    logger.info(f"Looking for components of type '{component_type}' in gameobject")
-    
     if not is_serialized_unity_object(gameobject):
-        logger.info("Object is not a serialized Unity object")
+        logger.debug("Object is not a serialized Unity object")
         return []
         
     components = get_unity_components(gameobject)
-    logger.info(f"Found {len(components)} components in the gameobject")
-    
-    # Normalize component_type by removing namespace if present
-    if '.' in component_type:
-        short_type = component_type.split('.')[-1]
-    else:
-        short_type = component_type
     
-    logger.info(f"Normalized type: short_type='{short_type}', full_type='{component_type}'")
+    # Normalize component_type by removing namespace if present; the query
+    # forms are worked out once rather than per component
+    short_type = component_type.rpartition('.')[2]
+    namespace_suffix = f".{short_type}"
     
     matching_components = []
     
-    for i, component in enumerate(components):
+    for component in components:
         # Get the component type directly from __unity_type or __type
         unity_type = component.get(SERIALIZATION_UNITY_TYPE_KEY, '')
-        type_name = component.get(SERIALIZATION_TYPE_KEY, '')
-        
-        logger.info(f"Examining component {i}: unity_type='{unity_type}', type='{type_name}'")
-        
-        # Extract short name from unity_type if it has a namespace
-        if '.' in unity_type:
-            unity_short_type = unity_type.split('.')[-1]
-        else:
-            unity_short_type = unity_type
-            
-        logger.info(f"Component {i} short type: '{unity_short_type}'")
         
         # Match by checking all possible forms of the type name
-        if (unity_type == component_type or                 # Exact full type match
-            unity_short_type == short_type or               # Short name match
-            type_name == short_type or                      # Type name match
-            unity_type.endswith(f".{short_type}")           # Namespace ending match
+        if (unity_type == component_type or                                # Exact full type match
+            unity_type.rpartition('.')[2] == short_type or                 # Short name match
+            component.get(SERIALIZATION_TYPE_KEY, '') == short_type or     # Type name match
+            unity_type.endswith(namespace_suffix)                          # Namespace ending match
            ):
-            logger.info(f"Component {i} MATCHED the search criteria")
             matching_components.append(component)
-        else:
-            logger.info(f"Component {i} did NOT match the search criteria")
             
-    logger.info(f"Found {len(matching_components)} matching components")
+    logger.debug("Found %d components of type '%s' in %d components",
+                 len(matching_components), component_type, len(components))
     return matching_components
 
 def find_gameobject_in_hierarchy(root: SerializedObject, name: str) -> Optional[SerializedObject]:
@@ -293,9 +274,10 @@ def resolve_circular_reference(obj: SerializedObject,
     Returns:
         The resolved object, or None if it cannot be resolved
     """
-    if not is_circular_reference(obj) or not root_object:
+    if not root_object:
         return None
         
+    # get_reference_path returns None for anything but a circular reference
     reference_path = get_reference_path(obj)
     if not reference_path:
         return None
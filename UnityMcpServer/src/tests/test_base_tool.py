@@ -100,4 +100,66 @@ async def test_send_command_async(test_tool, mock_unity_connection):
         "action": "create",
         "name": "TestObject",
         "type": "Cube"
-    }) 
\ No newline at end of file
+    })
+
+
+@pytest.mark.asyncio
+async def test_send_command_async_awaits_connection(mock_context):
+    """Test that a real UnityConnection is awaited directly instead of via a thread."""
+    from unittest.mock import AsyncMock
+    from unity_connection import UnityConnection
+    
+    conn = UnityConnection(sock=MagicMock())
+    conn.send_command = MagicMock()
+    conn.send_command_async = AsyncMock(return_value={"id": "123"})
+    
+    tool = MockTool(mock_context)
+    tool.unity_conn = conn
+    
+    result = await tool.send_command_async("test_tool", {
+        "action": "create",
+        "name": "TestObject",
+        "type": "Cube"
+    })
+    
+    assert result == {"id": "123"}
+    conn.send_command_async.assert_awaited_once_with("test_tool", {
+        "action": "create",
+        "name": "TestObject",
+        "type": "Cube"
+    })
+    conn.send_command.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_send_command_async_cancel_resets_stream():
+    """Test that cancelling an in-flight command drops the stream and its unread reply."""
+    import asyncio
+    from unittest.mock import AsyncMock
+    from unity_connection import UnityConnection
+    
+    conn = UnityConnection(sock=MagicMock())
+    writer = MagicMock()
+    writer.drain = AsyncMock()
+    
+    async def connect():
+        conn._reader, conn._writer = MagicMock(), writer
+    
+    conn._connect_async = connect
+    conn._receive_full_response_async = AsyncMock(side_effect=asyncio.CancelledError)
+    
+    with pytest.raises(asyncio.CancelledError):
+        await conn.send_command_async("ping")
+    
+    writer.close.assert_called_once()
+    assert conn._writer is None
+
+
+def test_tools_use_current_unity_connection(mock_context):
+    """Test that each new tool picks up the current shared Unity connection."""
+    first, second = MagicMock(), MagicMock()
+    
+    with patch('tools.base_tool.get_unity_connection', side_effect=[first, second]):
+        assert MockTool(mock_context).unity_conn is first
+        # The shared connection was replaced (e.g. after a reconnect)
+        assert MockTool(mock_context).unity_conn is second
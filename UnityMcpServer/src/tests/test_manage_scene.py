@@ -530,6 +530,34 @@ def test_scene_tool_validation(scene_tool_instance, mock_unity_connection):
     # Make sure the mock wasn't called unexpectedly
     mock_unity_connection.send_command.assert_not_called()
 
+def test_scene_tool_batch_validation(scene_tool_instance, mock_unity_connection):
+    """Test validation and conversion of batched scene operations."""
+    converted = scene_tool_instance.validate_and_convert_params("batch", {
+        "action": "batch",
+        "operations": [
+            {"action": "Save"},
+            {"action": "move", "game_object_name": "Player", "position": [1, 2, 3]}
+        ]
+    })
+    
+    # Each operation is lowercased and converted like a standalone call
+    assert converted["operations"][0]["action"] == "save"
+    assert converted["operations"][1]["position"] == {"x": 1.0, "y": 2.0, "z": 3.0}
+    
+    # Operations must have a valid, non-batch action
+    with pytest.raises(ParameterValidationError, match="Batch operation 0"):
+        scene_tool_instance.validate_and_convert_params("batch", {
+            "action": "batch", "operations": [{"action": "batch", "operations": []}]
+        })
+    
+    # Missing required parameters are reported with the operation index
+    with pytest.raises(ParameterValidationError, match="Batch operation 1 \\('move'\\)"):
+        scene_tool_instance.validate_and_convert_params("batch", {
+            "action": "batch", "operations": [{"action": "save"}, {"action": "move"}]
+        })
+    
+    mock_unity_connection.send_command.assert_not_called()
+
 @pytest.mark.asyncio
 async def test_scene_tool_validation_mode(registered_tool, mock_context, mock_unity_connection):
     """Test validation-only mode."""
@@ -24,6 +24,7 @@ from type_converters import (
     is_serialized_unity_object, extract_type_info, get_unity_components,
     get_unity_children, find_component_by_type, is_circular_reference, 
     get_reference_path, get_serialization_depth, get_serialized_value,
+    extract_transform_data, extract_all_transforms,
     SERIALIZATION_STATUS_KEY, SERIALIZATION_ERROR_KEY, SERIALIZATION_TYPE_KEY,
     SERIALIZATION_UNITY_TYPE_KEY, SERIALIZATION_PATH_KEY, SERIALIZATION_ID_KEY,
     SERIALIZATION_CIRCULAR_REF_KEY, SERIALIZATION_REF_PATH_KEY,
@@ -434,6 +435,12 @@ def test_serialization_depth_detection(basic_depth_object, standard_depth_object
     # Default behavior should return Basic for minimal objects
     assert get_serialization_depth(no_depth_obj) == SERIALIZATION_DEPTH_BASIC
     
+    # Inferred from children, skipping placeholders left by partial serialization
+    with_children = dict(no_depth_obj, children=[None, {"name": "Child"}])
+    assert get_serialization_depth(with_children) == SERIALIZATION_DEPTH_STANDARD
+    with_children["children"].append({"components": [{"__type": "Transform"}]})
+    assert get_serialization_depth(with_children) == SERIALIZATION_DEPTH_DEEP
+    
     # Test a validation function that would implement the default logic
     def validate_with_default_depth(obj):
         depth = get_serialization_depth(obj)
@@ -496,6 +503,75 @@ def test_serialization_depth_content(basic_depth_object, standard_depth_object,
     assert "__components" in grandchild
     assert len(grandchild["__components"]) > 0
 
+def test_extract_transform_data_by_depth(basic_depth_object, standard_depth_object):
+    """Test Transform extraction skips Basic depth objects"""
+    assert extract_transform_data(basic_depth_object) is None
+    
+    transform = extract_transform_data(standard_depth_object)
+    assert transform["position"] == {"x": 0.0, "y": 0.0, "z": 0.0}
+    assert transform["rotation"] == {"x": 0.0, "y": 0.0, "z": 0.0, "w": 1.0}
+
+def test_extract_transform_data_rotation_fields():
+    """Test serialized rotation fields are kept and only a missing one is derived"""
+    # Quaternion.Euler(10, 20, 30) as reported by Unity
+    rotation = {"x": 0.1276794, "y": 0.1448781, "z": 0.2392983, "w": 0.9515485}
+    euler = {"x": 10.0, "y": 20.0, "z": 30.0}
+
+    def gameobject(**fields):
+        transform = {"__type": "Component", "__unity_type": "UnityEngine.Transform"}
+        transform.update(fields)
+        return {"__type": "GameObject", "__serialization_depth": "Standard", "__components": [transform]}
+
+    # Both fields sent by the bridge are returned unchanged
+    transform = extract_transform_data(gameobject(rotation=rotation, eulerAngles=euler))
+    assert transform["rotation"] == rotation
+    assert transform["eulerAngles"] == euler
+
+    # Missing fields are derived with Unity's ZXY Euler convention
+    transform = extract_transform_data(gameobject(rotation=rotation))
+    assert transform["eulerAngles"] == pytest.approx(euler, abs=1e-4)
+
+    transform = extract_transform_data(gameobject(eulerAngles=euler))
+    assert transform["rotation"] == pytest.approx(rotation, abs=1e-6)
+
+def test_extract_all_transforms_euler_only():
+    """Test batch and single Transform extraction agree for euler-only rotations"""
+    np = pytest.importorskip("numpy")
+    
+    gameobject = {
+        "__type": "GameObject",
+        "__serialization_depth": "Standard",
+        "name": "Rotated",
+        "__components": [{
+            "__type": "Component",
+            "__unity_type": "UnityEngine.Transform",
+            "eulerAngles": {"x": 10.0, "y": 20.0, "z": 30.0}
+        }]
+    }
+    
+    single = extract_transform_data(gameobject)["rotation"]
+    batch = extract_all_transforms(gameobject, dtype=np.float64)["rotations"][0]
+    assert np.allclose(batch, [single["x"], single["y"], single["z"], single["w"]], atol=1e-9)
+    # Quaternion.Euler(10, 20, 30) as reported by Unity
+    assert np.allclose(batch, [0.1276794, 0.1448781, 0.2392983, 0.9515485], atol=1e-6)
+
+def test_extract_all_transforms(deep_depth_object):
+    """Test batch Transform extraction over a serialized hierarchy"""
+    np = pytest.importorskip("numpy")
+    
+    transforms = extract_all_transforms(deep_depth_object)
+    
+    # One row per GameObject with a Transform, in preorder
+    assert transforms["paths"] == ["DeepObject", "DeepObject/DeepChild", "DeepObject/DeepChild/GrandChild"]
+    assert transforms["positions"].shape == (3, 3)
+    assert transforms["rotations"].shape == (3, 4)
+    assert transforms["scales"].shape == (3, 3)
+    assert transforms["positions"].dtype == np.float32
+    
+    assert np.allclose(transforms["positions"], [[0.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.5, 0.0]])
+    assert np.allclose(transforms["rotations"], [[0.0, 0.0, 0.0, 1.0]] * 3)
+    assert np.allclose(transforms["scales"], 1.0)
+
 # ------------------------------------
 # Tests for Complex Circular References
 # ------------------------------------
@@ -2,7 +2,9 @@ import pytest
 import math
 from type_converters import (
     convert_vector2, convert_vector3, convert_quaternion,
-    convert_color, convert_rect, convert_bounds, euler_to_quaternion
+    convert_color, convert_rect, convert_bounds, euler_to_quaternion,
+    euler_to_quaternion_batch, quaternion_to_matrix_batch, quaternion_to_euler, Vec3, Quat, Color,
+    convert_vector3_batch, convert_quaternion_batch, convert_color_batch
 )
 from exceptions import ParameterValidationError
 
@@ -50,6 +52,12 @@ class TestTypeConverters:
         result = convert_vector3({"x": 5, "y": 6, "z": 7}, "test_vec3")
         assert result == {"x": 5.0, "y": 6.0, "z": 7.0}
         
+        # Canonical dicts are returned as-is, extra keys are dropped
+        canonical = {"x": 1.0, "y": 2.0, "z": 3.0}
+        assert convert_vector3(canonical, "test_vec3") is canonical
+        result = convert_vector3({"x": 1.0, "y": 2.0, "z": 3.0, "w": 4.0}, "test_vec3")
+        assert result == canonical
+        
         # Test invalid inputs
         with pytest.raises(ParameterValidationError):
             convert_vector3([1, 2], "test_vec3")  # Too few components
@@ -63,6 +71,22 @@ class TestTypeConverters:
         with pytest.raises(ParameterValidationError):
             convert_vector3("not_a_vector", "test_vec3")  # Wrong type
 
+    def test_numpy_array_input(self):
+        """Test converters accept 1-D numpy arrays."""
+        np = pytest.importorskip("numpy")
+        
+        assert convert_vector3(np.array([1, 2, 3]), "test_vec3") == {"x": 1.0, "y": 2.0, "z": 3.0}
+        assert convert_color(np.array([1.0, 0.5, 0.0]), "test_color")["a"] == 1.0
+        
+        with pytest.raises(ParameterValidationError):
+            convert_vector3(np.zeros(4), "test_vec3")
+        
+        # Arrays that are not 1-D are rejected as validation errors
+        with pytest.raises(ParameterValidationError, match="1-D array"):
+            convert_vector3(np.array(5.0), "test_vec3")
+        with pytest.raises(ParameterValidationError, match="1-D array"):
+            convert_quaternion(np.zeros((1, 4)), "test_quat")
+
     def test_quaternion_conversion(self):
         """Test Quaternion conversion with various input formats."""
         # Test list input
@@ -113,6 +137,116 @@ class TestTypeConverters:
         assert math.isclose(result["z"], 0.0, abs_tol=1e-6)
         assert math.isclose(result["w"], 0.7071068, abs_tol=1e-6)
 
+    def test_euler_to_quaternion_batch(self, monkeypatch):
+        """Test batch Euler conversion matches the single-value conversion."""
+        np = pytest.importorskip("numpy")
+        
+        eulers = [[0, 0, 0], [0, 90, 0], [90, 0, 0], [10, 20, 30]]
+        result = euler_to_quaternion_batch(eulers)
+        assert result.shape == (4, 4)
+        
+        for row, euler in zip(result, eulers):
+            expected = euler_to_quaternion(euler)
+            for actual, key in zip(row, ("x", "y", "z", "w")):
+                assert math.isclose(actual, expected[key], abs_tol=1e-6)
+        
+        # The numpy fallback used without numba gives the same result
+        monkeypatch.setattr("type_converters.njit", None)
+        assert np.allclose(euler_to_quaternion_batch(eulers), result, atol=1e-6)
+        
+        # Rows must be Euler triples
+        with pytest.raises(ParameterValidationError, match="expected shape"):
+            euler_to_quaternion_batch(np.zeros((2, 4)))
+
+    def test_quaternion_to_matrix_batch(self):
+        """Test batch quaternion to rotation matrix conversion."""
+        np = pytest.importorskip("numpy")
+        
+        # Identity and a 90 degree rotation about Y
+        half = math.sqrt(0.5)
+        result = quaternion_to_matrix_batch([[0, 0, 0, 1], [0, half, 0, half]])
+        assert result.shape == (2, 3, 3)
+        assert result.dtype == np.float32
+        assert np.allclose(result[0], np.eye(3), atol=1e-6)
+        assert np.allclose(result[1], [[0, 0, 1], [0, 1, 0], [-1, 0, 0]], atol=1e-6)
+        
+        # Rotation matrices are orthonormal
+        quats = euler_to_quaternion_batch([[10, 20, 30], [45, -60, 170]], dtype=np.float64)
+        for m in quaternion_to_matrix_batch(quats, dtype=np.float64):
+            assert np.allclose(m @ m.T, np.eye(3), atol=1e-9)
+        
+        with pytest.raises(ParameterValidationError, match="expected shape"):
+            quaternion_to_matrix_batch(np.zeros((2, 3)))
+
+    def test_batch_conversion(self):
+        """Test batch converters match the single-value converters."""
+        np = pytest.importorskip("numpy")
+        
+        vectors = [[1, 2, 3], (4.5, 5.5, 6.5)]
+        assert convert_vector3_batch(vectors) == [convert_vector3(v) for v in vectors]
+        assert convert_vector3_batch(np.zeros((0, 3))) == []
+        
+        quats = np.array([[0, 0, 0, 1], [0.5, 0.5, 0.5, 0.5]])
+        assert convert_quaternion_batch(quats) == [convert_quaternion(list(q)) for q in quats]
+        
+        assert convert_color_batch([[1, 0, 0, 1]]) == [{"r": 1.0, "g": 0.0, "b": 0.0, "a": 1.0}]
+        
+        # Invalid inputs
+        with pytest.raises(ParameterValidationError, match="expected shape"):
+            convert_vector3_batch([[1, 2]])
+        with pytest.raises(ParameterValidationError, match="finite"):
+            convert_vector3_batch([[1, 2, float("nan")]])
+        with pytest.raises(ParameterValidationError, match="convertible"):
+            convert_vector3_batch([["a", 2, 3]])
+        with pytest.raises(ParameterValidationError, match="between 0 and 1"):
+            convert_color_batch([[2, 0, 0, 1]])
+
+    def test_quaternion_to_euler(self):
+        """Test Quaternion to Euler angles conversion."""
+        # Identity rotation
+        result = quaternion_to_euler([0, 0, 0, 1])
+        for key in ("x", "y", "z"):
+            assert math.isclose(result[key], 0.0, abs_tol=1e-6)
+        
+        # Round trip through euler_to_quaternion, including gimbal lock
+        for euler in ([10, 20, 30], [-45, 60, 170], [30, 90, 20], [30, -90, 20]):
+            angles = quaternion_to_euler(euler_to_quaternion(euler))
+            original = euler_to_quaternion(euler)
+            round_trip = euler_to_quaternion([angles["x"], angles["y"], angles["z"]])
+            same = all(math.isclose(original[k], round_trip[k], abs_tol=1e-6) for k in "xyzw")
+            flipped = all(math.isclose(original[k], -round_trip[k], abs_tol=1e-6) for k in "xyzw")
+            assert same or flipped
+        
+        # Extrinsic zyx is the same rotation as intrinsic XYZ
+        quat = euler_to_quaternion([10, 20, 30])
+        extrinsic = quaternion_to_euler(quat, "zyx")
+        for key, expected in (("x", 10), ("y", 20), ("z", 30)):
+            assert math.isclose(extrinsic[key], expected, abs_tol=1e-6)
+        
+        # Radians output
+        result = quaternion_to_euler(euler_to_quaternion([0, 90, 0]), degrees=False)
+        assert math.isclose(result["y"], math.pi / 2, abs_tol=1e-6)
+        
+        # Invalid sequences
+        for seq in ("XYX", "xYz", "XY"):
+            with pytest.raises(ParameterValidationError, match="Invalid rotation sequence"):
+                quaternion_to_euler([0, 0, 0, 1], seq)
+
+    def test_typed_value_records(self):
+        """Test the slotted value records and their dict form."""
+        vec = Vec3.from_value({"x": 1, "y": 2, "z": 3})
+        assert vec == Vec3(1.0, 2.0, 3.0)
+        assert tuple(vec) == (1.0, 2.0, 3.0)
+        assert vec.to_dict() == convert_vector3([1, 2, 3])
+        assert not hasattr(vec, "__dict__")
+        
+        assert Quat.from_value([0, 0, 0, 1]).to_dict() == {"x": 0.0, "y": 0.0, "z": 0.0, "w": 1.0}
+        assert Color.from_value([1, 0.5, 0]).to_dict() == {"r": 1.0, "g": 0.5, "b": 0.0, "a": 1.0}
+        
+        # Validation errors come from the underlying converters
+        with pytest.raises(ParameterValidationError, match="Missing Vector3 components"):
+            Vec3.from_value({"x": 1, "y": 2})
+
     def test_color_conversion(self):
         """Test Color conversion with various input formats."""
         # Test RGB list input
@@ -131,6 +265,12 @@ class TestTypeConverters:
         result = convert_color({"r": 0.5, "g": 0.6, "b": 0.7, "a": 0.8}, "test_color")
         assert result == {"r": 0.5, "g": 0.6, "b": 0.7, "a": 0.8}
         
+        # Canonical RGBA dicts are returned as-is, but still range checked
+        canonical = {"r": 0.5, "g": 0.6, "b": 0.7, "a": 0.8}
+        assert convert_color(canonical, "test_color") is canonical
+        with pytest.raises(ParameterValidationError, match="r component"):
+            convert_color({"r": 1.5, "g": 0.6, "b": 0.7, "a": 0.8}, "test_color")
+        
         # Test value range validation
         with pytest.raises(ParameterValidationError):
             convert_color([1.1, 0.5, 0.5], "test_color")  # r > 1.0
@@ -179,7 +319,10 @@ class TestTypeConverters:
             "center": {"x": 10.0, "y": 20.0, "z": 30.0},
             "size": {"x": 40.0, "y": 50.0, "z": 60.0}
         }
-        
+
+        # Already-canonical bounds are returned unchanged
+        assert convert_bounds(result) is result
+
         # Test invalid inputs
         with pytest.raises(ParameterValidationError):
             convert_bounds({"center": [1, 2, 3]}, "test_bounds")  # Missing size
@@ -25,7 +25,8 @@ from type_converters import (
 from tools.validation_layer import (
     validate_asset_path, validate_gameobject_path, 
     validate_component_type, validate_action,
-    validate_gameobject_name
+    validate_gameobject_name, validate_parameters_by_action,
+    compile_action_param_map
 )
 from tools.manage_gameobject import GameObjectTool
 from tools.manage_scene import SceneTool
@@ -283,6 +284,23 @@ class TestParameterPresenceDetection:
         
         # The validation should not fail due to size
         validate_required_param(params, "contents", "create", "manage_script")
+    
+    def test_parameters_by_action_detection(self):
+        """Test detection of all missing parameters for an action."""
+        action_param_map = {"create": ["name", "path"], "delete": ["target"]}
+        
+        # Raw and precompiled maps behave the same
+        for param_map in (action_param_map, compile_action_param_map(action_param_map)):
+            validate_parameters_by_action("create", {"name": "A", "path": "Assets/A"}, param_map)
+            validate_parameters_by_action("refresh", {}, param_map)  # Unknown actions need nothing
+            
+            with pytest.raises(ParameterValidationError) as e:
+                validate_parameters_by_action("create", {"name": "A"}, param_map)
+            assert "requires 'path' parameter" in str(e.value)
+            
+            with pytest.raises(ParameterValidationError) as e:
+                validate_parameters_by_action("create", {}, param_map)
+            assert "requires 'name', 'path' parameters" in str(e.value)
 
 
 class TestParameterConsistency:
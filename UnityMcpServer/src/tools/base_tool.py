@@ -3,7 +3,7 @@ Base class for all Unity MCP tools with shared validation logic.
 """
 import asyncio
 from typing import Dict, Any, Optional, Type, List, Tuple, Union
-from unity_connection import get_unity_connection, ParameterValidationError
+from unity_connection import get_unity_connection, UnityConnection, ParameterValidationError
 from validation_utils import (
     validate_required_param, validate_param_type,
     validate_serialized_gameobject, validate_serialized_component, 
@@ -49,7 +49,8 @@ class BaseTool:
         self.ctx = ctx
         # Only get the connection if it's not already set
         # This allows tests to inject a mock connection
-        self.unity_conn = getattr(self, 'unity_conn', get_unity_connection())
+        if getattr(self, 'unity_conn', None) is None:
+            self.unity_conn = get_unity_connection()
     
     def validate_and_convert_params(self, action: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """Validate and convert parameters based on parameter type requirements.
@@ -257,25 +258,13 @@ class BaseTool:
             ParameterValidationError: If parameters fail validation
         """
         try:
-            # Use the helper method to handle parameters
-            converted_params, validate_only, action = self._handle_command_params(command_type, params)
-            
-            # If validation only and no Unity validation needed, return success
-            if validate_only and not self.needs_unity_validation(action, converted_params):
-                return {
-                    "success": True, 
-                    "message": "Parameters validated successfully", 
-                    "data": {"valid": True}
-                }
+            converted_params, action, early_response = self._prepare_command(command_type, params)
+            if early_response is not None:
+                return early_response
             
             # Send command using the Unity connection
             response = self.unity_conn.send_command(command_type, converted_params)
-            
-            # Post-process serialized Unity objects if needed
-            if isinstance(response, dict) and 'data' in response:
-                response = self.post_process_response(response, action, converted_params)
-                
-            return response
+            return self._finish_response(response, action, converted_params)
             
         except ParameterValidationError as e:
             # If this is a wrapped error response, unwrap and return it
@@ -285,6 +274,47 @@ class BaseTool:
             # Otherwise re-raise
             raise
     
+    def _prepare_command(self, command_type: str, params: Optional[Dict[str, Any]]) -> Tuple[Dict[str, Any], Optional[str], Optional[Dict[str, Any]]]:
+        """Validate and convert command parameters before sending them to Unity.
+        
+        Args:
+            command_type: The type of command to send
+            params: The parameters for the command
+            
+        Returns:
+            Tuple of (converted_params, action, early_response) where early_response
+            is set when validation alone answers the request
+        """
+        # Use the helper method to handle parameters
+        converted_params, validate_only, action = self._handle_command_params(command_type, params)
+        
+        # If validation only and no Unity validation needed, return success
+        if validate_only and not self.needs_unity_validation(action, converted_params):
+            return converted_params, action, {
+                "success": True, 
+                "message": "Parameters validated successfully", 
+                "data": {"valid": True}
+            }
+        
+        return converted_params, action, None
+    
+    def _finish_response(self, response: Any, action: Optional[str], params: Dict[str, Any]) -> Any:
+        """Apply response post-processing to a raw Unity response.
+        
+        Args:
+            response: The response returned by the Unity connection
+            action: The action that was sent
+            params: The converted parameters that were sent
+            
+        Returns:
+            The post-processed response
+        """
+        # Post-process serialized Unity objects if needed
+        if isinstance(response, dict) and 'data' in response:
+            response = self.post_process_response(response, action, params)
+            
+        return response
+    
     def post_process_response(self, response: Dict[str, Any], action: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """Post-process the response from Unity, especially for serialized objects.
         
@@ -337,7 +367,9 @@ class BaseTool:
     async def send_command_async(self, command_type: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
         """Send a command to Unity asynchronously with parameter validation and conversion.
         
-        This is an async wrapper around send_command.
+        When the tool uses the stock send_command and a real UnityConnection,
+        the command is awaited on the connection's stream socket directly.
+        Otherwise send_command runs on a worker thread.
         
         Args:
             command_type: The type of command to send
@@ -349,8 +381,25 @@ class BaseTool:
         Raises:
             ParameterValidationError: If parameters fail validation
         """
-        # Run the synchronous send_command
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None, self.send_command, command_type, params
-        ) 
\ No newline at end of file
+        if type(self).send_command is not BaseTool.send_command or not isinstance(self.unity_conn, UnityConnection):
+            # Run the synchronous send_command on the loop this coroutine runs on
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                None, self.send_command, command_type, params
+            )
+        
+        try:
+            converted_params, action, early_response = self._prepare_command(command_type, params)
+            if early_response is not None:
+                return early_response
+            
+            response = await self.unity_conn.send_command_async(command_type, converted_params)
+            return self._finish_response(response, action, converted_params)
+            
+        except ParameterValidationError as e:
+            # If this is a wrapped error response, unwrap and return it
+            if hasattr(e, 'error_response') and e.error_response:
+                return e.error_response
+            
+            # Otherwise re-raise
+            raise
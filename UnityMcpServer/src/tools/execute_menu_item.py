@@ -130,5 +130,5 @@ def validate_menu_path(menu_path: Any) -> None:
         raise ParameterValidationError("Menu path cannot be empty")
     
     # Check for menu separator
-    if "/" not in menu_path:
+    if menu_path.find("/") < 0:
         raise ParameterValidationError(f"Menu path must contain at least one '/' separator, got: {menu_path}") 
\ No newline at end of file
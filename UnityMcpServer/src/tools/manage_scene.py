@@ -2,6 +2,7 @@
 Defines the manage_scene tool for working with Unity scenes.
 """
 import asyncio
+import sys
 from typing import Dict, Any, Optional, List, Union, Literal, Tuple
 from mcp.server.fastmcp import FastMCP, Context
 from .base_tool import BaseTool
@@ -10,7 +11,7 @@ from exceptions import ParameterValidationError
 from .validation_layer import (
     validate_asset_path, validate_gameobject_path, 
     validate_component_type, validate_screenshot_path,
-    validate_action
+    validate_action, create_action_validator
 )
 
 class SceneTool(BaseTool):
@@ -24,9 +25,12 @@ class SceneTool(BaseTool):
         'get_open_scenes', 'close', 'instantiate', 'delete', 'move', 'rotate', 
         'scale', 'find', 'get_component', 'set_component', 'add_component', 
         'remove_component', 'get_position', 'get_rotation', 'get_scale', 
-        'set_parent', 'set_active', 'capture_screenshot'
+        'set_parent', 'set_active', 'capture_screenshot', 'batch'
     ]
     
+    # Actions that may appear inside a 'batch' operation (batches cannot nest)
+    BATCHABLE_ACTIONS = [a for a in VALID_ACTIONS if a != 'batch']
+    
     # Define required parameters for each action
     required_params = {
         "open": {"path": str},
@@ -43,6 +47,7 @@ class SceneTool(BaseTool):
         "set_parent": {"game_object_name": str, "parent_name": str},
         "set_active": {"game_object_name": str, "active_state": bool},
         "capture_screenshot": {"screenshot_path": str},
+        "batch": {"operations": list},
     }
     
     # Define parameters that should be validated as Vector3
@@ -51,6 +56,54 @@ class SceneTool(BaseTool):
     # Define parameters that should be validated as Euler angles (will be converted to Quaternion)
     euler_params = ["rotation"]
     
+    # Validator for the action of each operation in a batch, built once
+    _validate_batch_action = staticmethod(create_action_validator(BATCHABLE_ACTIONS))
+    
+    def validate_and_convert_params(self, action: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate and convert parameters, including each operation of a batch.
+        
+        Args:
+            action: The current action being performed
+            params: Parameters to validate
+            
+        Returns:
+            Dict[str, Any]: Converted parameters
+            
+        Raises:
+            ParameterValidationError: If validation fails
+        """
+        converted_params = super().validate_and_convert_params(action, params)
+        
+        if action == "batch":
+            converted_params["operations"] = [
+                self._convert_batch_operation(index, operation)
+                for index, operation in enumerate(converted_params["operations"])
+            ]
+        
+        return converted_params
+    
+    def _convert_batch_operation(self, index: int, operation: Any) -> Dict[str, Any]:
+        """Validate and convert a single operation of a 'batch' request."""
+        if not isinstance(operation, dict):
+            raise ParameterValidationError(
+                f"Batch operation {index} must be a dictionary, got {type(operation).__name__}"
+            )
+        
+        operation_action = operation.get("action")
+        if not isinstance(operation_action, str) or not operation_action:
+            raise ParameterValidationError(f"Batch operation {index} requires an 'action' parameter")
+        
+        operation_action = operation_action.lower()
+        try:
+            self._validate_batch_action(operation_action)
+            converted = super().validate_and_convert_params(
+                operation_action, {**operation, "action": operation_action}
+            )
+        except ParameterValidationError as e:
+            raise ParameterValidationError(f"Batch operation {index} ('{operation_action}'): {e}")
+        
+        return converted
+    
     def additional_validation(self, action: str, params: Dict[str, Any]) -> None:
         """Additional validation specific to the scene tool."""
         # Validate action is supported
@@ -97,6 +150,10 @@ class SceneTool(BaseTool):
                 raise ParameterValidationError(
                     f"component_properties must be a dictionary of property names and values"
                 )
+        
+        # Validate batch operations list
+        if action == "batch" and "operations" in params and not params["operations"]:
+            raise ParameterValidationError("Batch 'operations' list cannot be empty")
     
     def needs_unity_validation(self, action: str, params: Dict[str, Any]) -> bool:
         """Determine if a validate_only request needs to go to Unity for validation.
@@ -134,6 +191,10 @@ class SceneTool(BaseTool):
         # - If parent-child relationships are valid
         return True
     
+    # Pre-interned action strings, looked up instead of lowering the Literal
+    # action on every call (all valid actions are already lowercase)
+    _INTERNED_ACTIONS = {a: sys.intern(a) for a in VALID_ACTIONS}
+
     @staticmethod
     def register_manage_scene_tools(mcp: FastMCP):
         """Registers the manage_scene tool with the MCP server."""
@@ -141,7 +202,7 @@ class SceneTool(BaseTool):
         @mcp.tool()
         async def manage_scene(
             ctx: Context,
-            action: Literal['open', 'create', 'save', 'save_as', 'add_to_build', 'get_scene_info', 'get_open_scenes', 'close', 'instantiate', 'delete', 'move', 'rotate', 'scale', 'find', 'get_component', 'set_component', 'add_component', 'remove_component', 'get_position', 'get_rotation', 'get_scale', 'set_parent', 'set_active', 'capture_screenshot'],
+            action: Literal['open', 'create', 'save', 'save_as', 'add_to_build', 'get_scene_info', 'get_open_scenes', 'close', 'instantiate', 'delete', 'move', 'rotate', 'scale', 'find', 'get_component', 'set_component', 'add_component', 'remove_component', 'get_position', 'get_rotation', 'get_scale', 'set_parent', 'set_active', 'capture_screenshot', 'batch'],
             path: Optional[str] = None,
             name: Optional[str] = None,
             build_index: Optional[int] = None,
@@ -158,6 +219,7 @@ class SceneTool(BaseTool):
             query: Optional[str] = None,
             include_children: Optional[bool] = None,
             screenshot_path: Optional[str] = None,
+            operations: Optional[List[Dict[str, Any]]] = None,
             validate_only: Optional[bool] = None
         ) -> Dict[str, Any]:
             """Manages Unity scenes and GameObjects within them.
@@ -193,6 +255,7 @@ class SceneTool(BaseTool):
                     - 'set_parent': Set the parent of a GameObject
                     - 'set_active': Set the active state of a GameObject
                     - 'capture_screenshot': Take a screenshot of the scene view
+                    - 'batch': Run several scene operations in a single Unity round-trip
                 path: Path to the scene file (for 'open', 'save_as', 'add_to_build')
                     e.g., "Assets/Scenes/MainLevel.unity"
                 name: Name for a new scene or for a GameObject to find, create, or modify
@@ -211,6 +274,11 @@ class SceneTool(BaseTool):
                 query: Search query for finding GameObjects
                 include_children: Whether to include children in operations like find
                 screenshot_path: Path to save a screenshot, e.g., "Assets/Screenshots/scene_view.png"
+                operations: List of operation dictionaries for the 'batch' action. Each operation
+                    uses the same parameters as a single call, including its own 'action'.
+                    Operations run in order and the batch stops at the first one that fails;
+                    the batch then fails with that operation's error, and its data holds the
+                    results so far plus the failed operation's 'failedIndex'
                 validate_only: When true, only validates parameters without executing the operation.
                     Use this for preflight validation to check if parameters are valid.
 
@@ -225,6 +293,8 @@ class SceneTool(BaseTool):
                   - For 'find': List of found GameObjects
                   - For 'get_component'/'get_position'/'get_rotation'/'get_scale': Requested data
                   - For 'capture_screenshot': Path to the saved screenshot
+                  - For 'batch': List of per-operation results, in order (on failure, up to and
+                    including the failed operation)
                   
             Examples:
                 - Open a scene:
@@ -251,36 +321,57 @@ class SceneTool(BaseTool):
                 - Find GameObjects:
                   action="find", query="Player", include_children=True
                   
+                - Open a scene, then save it under a new path, in one round-trip:
+                  action="batch", operations=[
+                      {"action": "open", "path": "Assets/Scenes/Level1.unity"},
+                      {"action": "save_as", "path": "Assets/Scenes/Level1Copy.unity"}
+                  ]
+                  
                 - Validate operation without executing:
                   action="move", game_object_name="Player", position=[10, 0, 5], validate_only=True
             """
             # Create tool instance
             scene_tool = SceneTool(ctx)
             
-            # Prepare parameters for the C# handler
-            params_dict = {
-                "action": action.lower(),
-                "path": path,
-                "name": name,
-                "build_index": build_index,
-                "additive": additive,
-                "prefab_path": prefab_path,
-                "game_object_name": game_object_name,
-                "component_type": component_type,
-                "component_properties": component_properties,
-                "position": position,
-                "rotation": rotation,
-                "scale": scale,
-                "parent_name": parent_name,
-                "active_state": active_state,
-                "query": query,
-                "include_children": include_children,
-                "screenshot_path": screenshot_path,
-                "validate_only": validate_only
-            }
-            
-            # Remove None values to avoid sending unnecessary nulls
-            params_dict = {k: v for k, v in params_dict.items() if v is not None}
+            # Prepare parameters for the C# handler, skipping None values so we
+            # don't send unnecessary nulls (built in one pass, no throwaway dict)
+            params_dict = {"action": SceneTool._INTERNED_ACTIONS.get(action) or action.lower()}
+            if path is not None:
+                params_dict["path"] = path
+            if name is not None:
+                params_dict["name"] = name
+            if build_index is not None:
+                params_dict["build_index"] = build_index
+            if additive is not None:
+                params_dict["additive"] = additive
+            if prefab_path is not None:
+                params_dict["prefab_path"] = prefab_path
+            if game_object_name is not None:
+                params_dict["game_object_name"] = game_object_name
+            if component_type is not None:
+                params_dict["component_type"] = component_type
+            if component_properties is not None:
+                params_dict["component_properties"] = component_properties
+            if position is not None:
+                params_dict["position"] = position
+            if rotation is not None:
+                params_dict["rotation"] = rotation
+            if scale is not None:
+                params_dict["scale"] = scale
+            if parent_name is not None:
+                params_dict["parent_name"] = parent_name
+            if active_state is not None:
+                params_dict["active_state"] = active_state
+            if query is not None:
+                params_dict["query"] = query
+            if include_children is not None:
+                params_dict["include_children"] = include_children
+            if screenshot_path is not None:
+                params_dict["screenshot_path"] = screenshot_path
+            if operations is not None:
+                params_dict["operations"] = operations
+            if validate_only is not None:
+                params_dict["validate_only"] = validate_only
 
             try:
                 # Send command with validation through the tool
@@ -311,28 +402,3 @@ def validate_component_type(component_type: Any) -> None:
     # Validate component type format (should be like UnityEngine.Transform or FullNamespace.ComponentName)
     if not ("." in component_type and component_type.split(".")[-1] and component_type.split(".")[0]):
         raise ParameterValidationError(f"Component type must be in format 'Namespace.ComponentName', got: {component_type}")
-
-def validate_screenshot_path(path: Any) -> None:
-    """Validate a screenshot save path parameter.
-
-    Args:
-        path: The path to validate
-    
-    Returns:
-        None: This function doesn't return anything but raises exceptions on validation failure
-    
-    Raises:
-        ParameterValidationError: If validation fails
-    """
-    # Check type
-    if not isinstance(path, str):
-        raise ParameterValidationError(f"Screenshot path must be a string, got {type(path).__name__}: {path}")
-    
-    # Check for empty path
-    if not path:
-        raise ParameterValidationError("Screenshot path cannot be empty")
-    
-    # Check file extension
-    valid_extensions = ['.png', '.jpg', '.jpeg']
-    if not any(path.lower().endswith(ext) for ext in valid_extensions):
-        raise ParameterValidationError(f"Screenshot path must end with one of {valid_extensions}, got: {path}")
\ No newline at end of file
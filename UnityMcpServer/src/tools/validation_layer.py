@@ -4,11 +4,26 @@ Validation layer for Unity MCP tools.
 This module provides a set of standardized validation functions that ensure
 consistent parameter validation across all tools, with clear and helpful error messages.
 """
-from typing import List, Dict, Any, Union, Optional
+from typing import List, Dict, Any, Union, Optional, Collection, FrozenSet
 from unity_connection import ParameterValidationError
+import functools
 import os
 import re
 
+# Valid screenshot file extensions, and the longest of them
+_SCREENSHOT_EXTENSIONS = (".png", ".jpg", ".jpeg")
+_SCREENSHOT_SUFFIX_LEN = max(len(ext) for ext in _SCREENSHOT_EXTENSIONS)
+
+def _raise_not_str(label: str, value: Any, show_value: bool = True) -> None:
+    """Raise the standard "must be a string" error.
+    
+    Kept out of line so the validators only format error messages on failure.
+    """
+    message = f"{label} must be a string, got {type(value).__name__}"
+    if show_value:
+        message += f": {value}"
+    raise ParameterValidationError(message)
+
 def validate_gameobject_name(name: Any) -> None:
     """Validate a GameObject name parameter.
     
@@ -20,7 +35,7 @@ def validate_gameobject_name(name: Any) -> None:
     """
     # Check type
     if not isinstance(name, str):
-        raise ParameterValidationError(f"GameObject name must be a string, got {type(name).__name__}: {name}")
+        _raise_not_str("GameObject name", name)
     
     # Check for empty name
     if not name:
@@ -42,19 +57,29 @@ def validate_asset_path(path: Any, must_exist: bool = False, extension: Optional
     """
     # Check type
     if not isinstance(path, str):
-        raise ParameterValidationError(f"Asset path must be a string, got {type(path).__name__}: {path}")
+        _raise_not_str("Asset path", path)
     
     # Check for empty path
     if not path:
         raise ParameterValidationError("Asset path cannot be empty")
     
+    # Check prefix and extension (cached, agents reuse the same paths a lot)
+    error = _asset_path_format_error(path, extension)
+    if error:
+        raise ParameterValidationError(error)
+
+@functools.lru_cache(maxsize=512)
+def _asset_path_format_error(path: str, extension: Optional[str]) -> Optional[str]:
+    """Return the format error message for an asset path, or None if it is valid."""
     # Check for Assets prefix
     if not path.startswith("Assets/"):
-        raise ParameterValidationError(f"Asset path must start with 'Assets/', got: {path}")
+        return f"Asset path must start with 'Assets/', got: {path}"
     
     # Check file extension if specified
     if extension and not path.endswith(extension):
-        raise ParameterValidationError(f"Asset path must end with '{extension}', got: {path}")
+        return f"Asset path must end with '{extension}', got: {path}"
+    
+    return None
 
 def validate_gameobject_path(path: Any, parameter_name: str = "path") -> None:
     """Validate a GameObject path parameter.
@@ -71,7 +96,7 @@ def validate_gameobject_path(path: Any, parameter_name: str = "path") -> None:
     """
     # Check type
     if not isinstance(path, str):
-        raise ParameterValidationError(f"Parameter '{parameter_name}' must be a string, got {type(path).__name__}: {path}")
+        _raise_not_str(f"Parameter '{parameter_name}'", path)
     
     # Check for empty path
     if not path:
@@ -94,7 +119,7 @@ def validate_component_type(component_type: Any) -> None:
     """
     # Check type
     if not isinstance(component_type, str):
-        raise ParameterValidationError(f"Component type must be a string, got {type(component_type).__name__}: {component_type}")
+        _raise_not_str("Component type", component_type)
     
     # Check for empty type
     if not component_type:
@@ -111,7 +136,7 @@ def validate_menu_path(menu_path: Any) -> None:
     """
     # Check type
     if not isinstance(menu_path, str):
-        raise ParameterValidationError(f"Menu path must be a string, got {type(menu_path).__name__}: {menu_path}")
+        _raise_not_str("Menu path", menu_path)
     
     # Check for empty path
     if not menu_path:
@@ -132,7 +157,7 @@ def validate_script_code(code: Any) -> None:
     """
     # Check type
     if not isinstance(code, str):
-        raise ParameterValidationError(f"Script code must be a string, got {type(code).__name__}")
+        _raise_not_str("Script code", code, show_value=False)
     
     # Not checking content - empty scripts are valid
 
@@ -141,22 +166,24 @@ def validate_screenshot_path(path: Any) -> None:
     
     Args:
         path: The path to validate
-        
+    
+    Returns:
+        None: This function doesn't return anything but raises exceptions on validation failure
+    
     Raises:
         ParameterValidationError: If validation fails
     """
     # Check type
     if not isinstance(path, str):
-        raise ParameterValidationError(f"Screenshot path must be a string, got {type(path).__name__}: {path}")
+        _raise_not_str("Screenshot path", path)
     
     # Check for empty path
     if not path:
         raise ParameterValidationError("Screenshot path cannot be empty")
     
-    # Check file extension
-    valid_extensions = [".png", ".jpg", ".jpeg"]
-    if not any(path.lower().endswith(ext) for ext in valid_extensions):
-        raise ParameterValidationError(f"Screenshot path must end with {', '.join(valid_extensions)}, got: {path}")
+    # Check file extension (only the tail can match, so only the tail is lowered)
+    if not path[-_SCREENSHOT_SUFFIX_LEN:].lower().endswith(_SCREENSHOT_EXTENSIONS):
+        raise ParameterValidationError(f"Screenshot path must end with {', '.join(_SCREENSHOT_EXTENSIONS)}, got: {path}")
 
 def validate_action(action: Any, valid_actions: List[str]) -> None:
     """Validate an action parameter against a list of valid actions.
@@ -173,7 +200,7 @@ def validate_action(action: Any, valid_actions: List[str]) -> None:
     """
     # Check type
     if not isinstance(action, str):
-        raise ParameterValidationError(f"Action must be a string, got {type(action).__name__}: {action}")
+        _raise_not_str("Action", action)
     
     # First, check if the action is directly valid (exact case match)
     if action in valid_actions:
@@ -193,13 +220,31 @@ def validate_action(action: Any, valid_actions: List[str]) -> None:
         # No match found, provide the full list of valid actions
         raise ParameterValidationError(f"Action '{action}' is not valid. Action must be one of: {', '.join(valid_actions)}. Available actions are: {', '.join(valid_actions)}, got: {action}")
 
-def validate_parameters_by_action(action: str, params: Dict[str, Any], action_param_map: Dict[str, List[str]]) -> None:
+# Shared "no required parameters" entry for actions missing from a map
+_EMPTY: FrozenSet[str] = frozenset()
+
+def compile_action_param_map(action_param_map: Dict[str, List[str]]) -> Dict[str, FrozenSet[str]]:
+    """Precompute the required parameter set for each action.
+    
+    Args:
+        action_param_map: Mapping of actions to required parameter lists
+    
+    Returns:
+        Dict[str, FrozenSet[str]]: Mapping of actions to frozensets of required parameters,
+            suitable for passing to validate_parameters_by_action
+    """
+    return {action: frozenset(params) for action, params in action_param_map.items()}
+
+def validate_parameters_by_action(action: str, params: Dict[str, Any], action_param_map: Dict[str, Collection[str]]) -> None:
     """Validate that all required parameters for an action are present.
     
+    All missing parameters are reported at once. Passing a map prepared with
+    compile_action_param_map() turns the check into a single set difference.
+    
     Args:
         action: The current action
         params: Parameter dictionary to validate
-        action_param_map: Mapping of actions to required parameter lists
+        action_param_map: Mapping of actions to required parameters (lists or frozensets)
     
     Returns:
         None: This function doesn't return anything but raises exceptions on validation failure
@@ -207,16 +252,16 @@ def validate_parameters_by_action(action: str, params: Dict[str, Any], action_pa
     Raises:
         ParameterValidationError: If validation fails
     """
-    # Get required params for this action
-    if action not in action_param_map:
-        return  # No validation needed for this action
-    
-    required_params = action_param_map[action]
+    # Actions without an entry have no required parameters
+    required = action_param_map.get(action, _EMPTY)
     
-    # Check for missing parameters
-    for param in required_params:
-        if param not in params:
-            raise ParameterValidationError(f"Action '{action}' requires '{param}' parameter")
+    # dict_keys supports set difference against any iterable of keys
+    missing = required - params.keys()
+    if missing:
+        if len(missing) == 1:
+            raise ParameterValidationError(f"Action '{action}' requires '{next(iter(missing))}' parameter")
+        missing_str = "', '".join(sorted(missing))
+        raise ParameterValidationError(f"Action '{action}' requires '{missing_str}' parameters")
 
 def create_action_validator(valid_actions: List[str]) -> callable:
     """Create an action validator function for a specific set of valid actions.
@@ -7,13 +7,43 @@ Each converter handles validation and standardizes the format for the Unity brid
 
 The module also includes functions for handling enhanced serialized Unity objects
 with support for metadata, circular references, and hierarchical relationships.
+
+Unity stores vectors, quaternions and colors as 32-bit floats. The scalar
+converters return Python floats, while the numpy batch helpers default to
+float32 so they carry no more precision than Unity keeps.
 """
 
 from typing import Any, Dict, List, Tuple, Union, Optional
+from dataclasses import dataclass, fields
+import functools
 import math
+import sys
 from exceptions import ParameterValidationError
 import logging
 
+logger = logging.getLogger(__name__)
+
+# Optional accelerators for the Euler/Quaternion math. Both are optional:
+# without numba the kernels run as plain Python, and the batch API needs numpy.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+# Optional compiled fast paths (see _type_converters_c.pyx); when the extension
+# is not built, the pure Python converters below handle everything.
+try:
+    from _type_converters_c import vector3 as _c_vector3, quaternion as _c_quaternion
+except ImportError:
+    _c_vector3 = None
+    _c_quaternion = None
+
 # Type aliases for clarity
 Vector2Type = Union[Dict[str, float], List[float], Tuple[float, float]]
 Vector3Type = Union[Dict[str, float], List[float], Tuple[float, float, float]]
@@ -38,11 +68,248 @@ SERIALIZATION_FALLBACK_KEY = "__used_fallback"
 SERIALIZATION_CHILDREN_KEY = "__children"
 SERIALIZATION_COMPONENTS_KEY = "__components"
 
+# Required keys for the dict form of each converted type
+_VECTOR2_KEYS = frozenset({"x", "y"})
+_VECTOR3_KEYS = frozenset({"x", "y", "z"})
+_QUATERNION_KEYS = frozenset({"x", "y", "z", "w"})
+_RECT_KEYS = frozenset({"x", "y", "width", "height"})
+_BOUNDS_KEYS = frozenset({"center", "size"})
+
+# Metadata keys that mark a dict as an enhanced-serialized Unity object
+_META_MARKERS = frozenset({
+    SERIALIZATION_TYPE_KEY,
+    SERIALIZATION_UNITY_TYPE_KEY,
+    SERIALIZATION_STATUS_KEY,
+})
+
+# Keys whose presence means an object carries more than Basic depth info
+_DEPTH_MARKERS = frozenset({
+    "components",
+    "children",
+    SERIALIZATION_COMPONENTS_KEY,
+    SERIALIZATION_CHILDREN_KEY,
+})
+
 # Serialization depth levels
 SERIALIZATION_DEPTH_BASIC = "Basic"
 SERIALIZATION_DEPTH_STANDARD = "Standard"
 SERIALIZATION_DEPTH_DEEP = "Deep"
 
+class _UnityValue:
+    """Shared helpers for the typed Unity value records below.
+    
+    The records are frozen, slotted dataclasses used for in-process handling
+    of converted values; to_dict() produces the dict form the Unity bridge
+    expects at the serialization boundary.
+    """
+    __slots__ = ()
+    
+    def __iter__(self):
+        for f in fields(self):
+            yield getattr(self, f.name)
+    
+    def to_dict(self) -> Dict[str, float]:
+        """Return the dict form sent to Unity.
+        
+        Returns:
+            Dictionary mapping component names to floats
+        """
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+
+@dataclass(slots=True, frozen=True)
+class Vec2(_UnityValue):
+    """Typed Vector2 value."""
+    x: float
+    y: float
+    
+    @classmethod
+    def from_value(cls, value: Vector2Type, param_name: str = "Vector2") -> "Vec2":
+        """Validate a Vector2 parameter and return it as a Vec2.
+        
+        Args:
+            value: The Vector2 value as dict, list, or tuple
+            param_name: Name of the parameter for error reporting
+            
+        Returns:
+            Vec2 instance
+        """
+        v = convert_vector2(value, param_name)
+        return cls(v["x"], v["y"])
+
+
+@dataclass(slots=True, frozen=True)
+class Vec3(_UnityValue):
+    """Typed Vector3 value."""
+    x: float
+    y: float
+    z: float
+    
+    @classmethod
+    def from_value(cls, value: Vector3Type, param_name: str = "Vector3") -> "Vec3":
+        """Validate a Vector3 parameter and return it as a Vec3.
+        
+        Args:
+            value: The Vector3 value as dict, list, or tuple
+            param_name: Name of the parameter for error reporting
+            
+        Returns:
+            Vec3 instance
+        """
+        v = convert_vector3(value, param_name)
+        return cls(v["x"], v["y"], v["z"])
+
+
+@dataclass(slots=True, frozen=True)
+class Vec4(_UnityValue):
+    """Typed Vector4 value."""
+    x: float
+    y: float
+    z: float
+    w: float
+
+
+@dataclass(slots=True, frozen=True)
+class Quat(_UnityValue):
+    """Typed Quaternion value."""
+    x: float
+    y: float
+    z: float
+    w: float
+    
+    @classmethod
+    def from_value(cls, value: QuaternionType, param_name: str = "Quaternion") -> "Quat":
+        """Validate a Quaternion parameter and return it as a Quat.
+        
+        Args:
+            value: The Quaternion value as dict, list, or tuple
+            param_name: Name of the parameter for error reporting
+            
+        Returns:
+            Quat instance
+        """
+        v = convert_quaternion(value, param_name)
+        return cls(v["x"], v["y"], v["z"], v["w"])
+
+
+@dataclass(slots=True, frozen=True)
+class Color(_UnityValue):
+    """Typed RGBA Color value."""
+    r: float
+    g: float
+    b: float
+    a: float = 1.0
+    
+    @classmethod
+    def from_value(cls, value: ColorType, param_name: str = "Color") -> "Color":
+        """Validate a Color parameter and return it as a Color.
+        
+        Args:
+            value: The Color value as dict, list, or tuple (RGBA format)
+            param_name: Name of the parameter for error reporting
+            
+        Returns:
+            Color instance
+        """
+        v = convert_color(value, param_name)
+        return cls(v["r"], v["g"], v["b"], v["a"])
+
+
+@dataclass(slots=True, frozen=True)
+class Rect(_UnityValue):
+    """Typed Rect value."""
+    x: float
+    y: float
+    width: float
+    height: float
+    
+    @classmethod
+    def from_value(cls, value: RectType, param_name: str = "Rect") -> "Rect":
+        """Validate a Rect parameter and return it as a Rect.
+        
+        Args:
+            value: The Rect value as dict, list, or tuple
+            param_name: Name of the parameter for error reporting
+            
+        Returns:
+            Rect instance
+        """
+        v = convert_rect(value, param_name)
+        return cls(v["x"], v["y"], v["width"], v["height"])
+
+
+def _resolve_converter(value: Any, param_name: str, dispatch: Dict[type, Any]):
+    """Find the converter for a value whose exact type is not in a dispatch table.
+    
+    Handles None, numpy arrays and subclasses of list, tuple and dict; raises
+    for anything else.
+    """
+    if value is None:
+        raise ParameterValidationError(f"{param_name} cannot be None")
+    
+    # Convert numpy arrays to plain floats once and reuse the list converter;
+    # only 1-D arrays are sequences of components
+    if np is not None and isinstance(value, np.ndarray):
+        if value.ndim != 1:
+            raise ParameterValidationError(
+                f"Invalid {param_name} value: Expected a 1-D array, got shape {value.shape}"
+            )
+        from_seq = dispatch[list]
+        return lambda array, name: from_seq(array.tolist(), name)
+    
+    for base, handler in dispatch.items():
+        if isinstance(value, base):
+            return handler
+    
+    raise ParameterValidationError(
+        f"Invalid {param_name} value: Expected list, tuple or dict, got {type(value).__name__}"
+    )
+
+
+def _vector2_from_seq(value, param_name: str) -> Dict[str, float]:
+    """Convert a Vector2 given as a list or tuple."""
+    if len(value) != 2:
+        raise ParameterValidationError(
+            f"Invalid {param_name} value: Vector2 must have exactly 2 components, got {len(value)}"
+        )
+    
+    x, y = value
+    try:
+        return {"x": float(x), "y": float(y)}
+    except (ValueError, TypeError):
+        raise ParameterValidationError(
+            f"Invalid {param_name} value: Vector2 components must be convertible to float"
+        )
+
+
+def _vector2_from_dict(value, param_name: str) -> Dict[str, float]:
+    """Convert a Vector2 given as a dict."""
+    try:
+        x = value["x"]
+        y = value["y"]
+    except KeyError:
+        missing_keys = _VECTOR2_KEYS - value.keys()
+        raise ParameterValidationError(
+            f"Invalid {param_name} value: Missing Vector2 components: {', '.join(missing_keys)}"
+        )
+    
+    # A plain dict of exactly these float components is already canonical and
+    # is returned as-is
+    if type(x) is float and type(y) is float:
+        return value if type(value) is dict and len(value) == 2 else {"x": x, "y": y}
+    
+    try:
+        return {"x": float(x), "y": float(y)}
+    except (ValueError, TypeError):
+        raise ParameterValidationError(
+            f"Invalid {param_name} value: Vector2 components must be convertible to float"
+        )
+
+
+# Converters keyed by the exact input type; JSON input is always plain list/dict
+_VECTOR2_DISPATCH = {list: _vector2_from_seq, tuple: _vector2_from_seq, dict: _vector2_from_dict}
+
+
 def convert_vector2(value: Vector2Type, param_name: str = "Vector2") -> Dict[str, float]:
     """Convert and validate a Vector2 parameter.
     
@@ -56,46 +323,54 @@ def convert_vector2(value: Vector2Type, param_name: str = "Vector2") -> Dict[str
     Raises:
         ParameterValidationError: If validation fails
     """
-    if value is None:
-        raise ParameterValidationError(f"{param_name} cannot be None")
-        
-    error_prefix = f"Invalid {param_name} value"
+    handler = _VECTOR2_DISPATCH.get(type(value))
+    if handler is None:
+        handler = _resolve_converter(value, param_name, _VECTOR2_DISPATCH)
+    return handler(value, param_name)
+
+
+def _vector3_from_seq(value, param_name: str) -> Dict[str, float]:
+    """Convert a Vector3 given as a list or tuple."""
+    if len(value) != 3:
+        raise ParameterValidationError(
+            f"Invalid {param_name} value: Vector3 must have exactly 3 components, got {len(value)}"
+        )
     
-    # Convert list/tuple to dict
-    if isinstance(value, (list, tuple)):
-        if len(value) != 2:
-            raise ParameterValidationError(
-                f"{error_prefix}: Vector2 must have exactly 2 components, got {len(value)}"
-            )
-        
-        try:
-            return {"x": float(value[0]), "y": float(value[1])}
-        except (ValueError, TypeError):
-            raise ParameterValidationError(
-                f"{error_prefix}: Vector2 components must be convertible to float"
-            )
-                
-    # Validate and standardize dict format
-    elif isinstance(value, dict):
-        required_keys = {"x", "y"}
-        missing_keys = required_keys - set(value.keys())
-        if missing_keys:
-            raise ParameterValidationError(
-                f"{error_prefix}: Missing Vector2 components: {', '.join(missing_keys)}"
-            )
-            
-        try:
-            return {"x": float(value["x"]), "y": float(value["y"])}
-        except (ValueError, TypeError):
-            raise ParameterValidationError(
-                f"{error_prefix}: Vector2 components must be convertible to float"
-            )
-    else:
+    x, y, z = value
+    try:
+        return {"x": float(x), "y": float(y), "z": float(z)}
+    except (ValueError, TypeError):
         raise ParameterValidationError(
-            f"{error_prefix}: Expected list, tuple or dict, got {type(value).__name__}"
+            f"Invalid {param_name} value: Vector3 components must be convertible to float"
         )
 
 
+def _vector3_from_dict(value, param_name: str) -> Dict[str, float]:
+    """Convert a Vector3 given as a dict."""
+    try:
+        x = value["x"]
+        y = value["y"]
+        z = value["z"]
+    except KeyError:
+        missing_keys = _VECTOR3_KEYS - value.keys()
+        raise ParameterValidationError(
+            f"Invalid {param_name} value: Missing Vector3 components: {', '.join(missing_keys)}"
+        )
+    
+    if type(x) is float and type(y) is float and type(z) is float:
+        return value if type(value) is dict and len(value) == 3 else {"x": x, "y": y, "z": z}
+    
+    try:
+        return {"x": float(x), "y": float(y), "z": float(z)}
+    except (ValueError, TypeError):
+        raise ParameterValidationError(
+            f"Invalid {param_name} value: Vector3 components must be convertible to float"
+        )
+
+
+_VECTOR3_DISPATCH = {list: _vector3_from_seq, tuple: _vector3_from_seq, dict: _vector3_from_dict}
+
+
 def convert_vector3(value: Vector3Type, param_name: str = "Vector3") -> Dict[str, float]:
     """Convert and validate a Vector3 parameter.
     
@@ -109,46 +384,63 @@ def convert_vector3(value: Vector3Type, param_name: str = "Vector3") -> Dict[str
     Raises:
         ParameterValidationError: If validation fails
     """
-    if value is None:
-        raise ParameterValidationError(f"{param_name} cannot be None")
-        
-    error_prefix = f"Invalid {param_name} value"
+    if _c_vector3 is not None:
+        result = _c_vector3(value)
+        if result is not None:
+            return result
     
-    # Convert list/tuple to dict
-    if isinstance(value, (list, tuple)):
-        if len(value) != 3:
-            raise ParameterValidationError(
-                f"{error_prefix}: Vector3 must have exactly 3 components, got {len(value)}"
-            )
-        
-        try:
-            return {"x": float(value[0]), "y": float(value[1]), "z": float(value[2])}
-        except (ValueError, TypeError):
-            raise ParameterValidationError(
-                f"{error_prefix}: Vector3 components must be convertible to float"
-            )
-                
-    # Validate and standardize dict format
-    elif isinstance(value, dict):
-        required_keys = {"x", "y", "z"}
-        missing_keys = required_keys - set(value.keys())
-        if missing_keys:
-            raise ParameterValidationError(
-                f"{error_prefix}: Missing Vector3 components: {', '.join(missing_keys)}"
-            )
-            
-        try:
-            return {"x": float(value["x"]), "y": float(value["y"]), "z": float(value["z"])}
-        except (ValueError, TypeError):
-            raise ParameterValidationError(
-                f"{error_prefix}: Vector3 components must be convertible to float"
-            )
-    else:
+    handler = _VECTOR3_DISPATCH.get(type(value))
+    if handler is None:
+        handler = _resolve_converter(value, param_name, _VECTOR3_DISPATCH)
+    return handler(value, param_name)
+
+
+def _quaternion_from_seq(value, param_name: str) -> Dict[str, float]:
+    """Convert a Quaternion given as a list or tuple."""
+    if len(value) != 4:
         raise ParameterValidationError(
-            f"{error_prefix}: Expected list, tuple or dict, got {type(value).__name__}"
+            f"Invalid {param_name} value: Quaternion must have exactly 4 components, got {len(value)}"
+        )
+    
+    x, y, z, w = value
+    try:
+        return {"x": float(x), "y": float(y), "z": float(z), "w": float(w)}
+    except (ValueError, TypeError):
+        raise ParameterValidationError(
+            f"Invalid {param_name} value: Quaternion components must be convertible to float"
         )
 
 
+def _quaternion_from_dict(value, param_name: str) -> Dict[str, float]:
+    """Convert a Quaternion given as a dict."""
+    try:
+        x = value["x"]
+        y = value["y"]
+        z = value["z"]
+        w = value["w"]
+    except KeyError:
+        missing_keys = _QUATERNION_KEYS - value.keys()
+        raise ParameterValidationError(
+            f"Invalid {param_name} value: Missing Quaternion components: {', '.join(missing_keys)}"
+        )
+    
+    if (type(x) is float and type(y) is float
+            and type(z) is float and type(w) is float):
+        if type(value) is dict and len(value) == 4:
+            return value
+        return {"x": x, "y": y, "z": z, "w": w}
+    
+    try:
+        return {"x": float(x), "y": float(y), "z": float(z), "w": float(w)}
+    except (ValueError, TypeError):
+        raise ParameterValidationError(
+            f"Invalid {param_name} value: Quaternion components must be convertible to float"
+        )
+
+
+_QUATERNION_DISPATCH = {list: _quaternion_from_seq, tuple: _quaternion_from_seq, dict: _quaternion_from_dict}
+
+
 def convert_quaternion(value: QuaternionType, param_name: str = "Quaternion") -> Dict[str, float]:
     """Convert and validate a Quaternion parameter.
     
@@ -162,46 +454,77 @@ def convert_quaternion(value: QuaternionType, param_name: str = "Quaternion") ->
     Raises:
         ParameterValidationError: If validation fails
     """
-    if value is None:
-        raise ParameterValidationError(f"{param_name} cannot be None")
-        
-    error_prefix = f"Invalid {param_name} value"
+    if _c_quaternion is not None:
+        result = _c_quaternion(value)
+        if result is not None:
+            return result
     
-    # Convert list/tuple to dict
-    if isinstance(value, (list, tuple)):
-        if len(value) != 4:
-            raise ParameterValidationError(
-                f"{error_prefix}: Quaternion must have exactly 4 components, got {len(value)}"
-            )
-        
-        try:
-            return {"x": float(value[0]), "y": float(value[1]), 
-                    "z": float(value[2]), "w": float(value[3])}
-        except (ValueError, TypeError):
-            raise ParameterValidationError(
-                f"{error_prefix}: Quaternion components must be convertible to float"
-            )
-                
-    # Validate and standardize dict format
-    elif isinstance(value, dict):
-        required_keys = {"x", "y", "z", "w"}
-        missing_keys = required_keys - set(value.keys())
-        if missing_keys:
-            raise ParameterValidationError(
-                f"{error_prefix}: Missing Quaternion components: {', '.join(missing_keys)}"
-            )
-            
-        try:
-            return {"x": float(value["x"]), "y": float(value["y"]), 
-                    "z": float(value["z"]), "w": float(value["w"])}
-        except (ValueError, TypeError):
-            raise ParameterValidationError(
-                f"{error_prefix}: Quaternion components must be convertible to float"
-            )
-    else:
-        raise ParameterValidationError(
-            f"{error_prefix}: Expected list, tuple or dict, got {type(value).__name__}"
-        )
+    handler = _QUATERNION_DISPATCH.get(type(value))
+    if handler is None:
+        handler = _resolve_converter(value, param_name, _QUATERNION_DISPATCH)
+    return handler(value, param_name)
+
+
+# Degrees to radians, halved, for the quaternion half-angle formulas
+_HALF_DEG2RAD = math.pi / 360.0
+
+
+def _euler_to_quat_scalar(x, y, z):
+    """Convert Euler angles in degrees to quaternion components (qx, qy, qz, qw)."""
+    # Half angles in radians
+    hx = x * _HALF_DEG2RAD
+    hy = y * _HALF_DEG2RAD
+    hz = z * _HALF_DEG2RAD
+    
+    # Calculate quaternion components
+    c1 = math.cos(hx)
+    s1 = math.sin(hx)
+    c2 = math.cos(hy)
+    s2 = math.sin(hy)
+    c3 = math.cos(hz)
+    s3 = math.sin(hz)
+    
+    # Multiply the matrices
+    qx = s1 * c2 * c3 + c1 * s2 * s3
+    qy = c1 * s2 * c3 - s1 * c2 * s3
+    qz = c1 * c2 * s3 + s1 * s2 * c3
+    qw = c1 * c2 * c3 - s1 * s2 * s3
+    
+    return qx, qy, qz, qw
+
+
+def _euler_to_quat_rows(angles, out):
+    """Fill out[i] with the quaternion for the Euler angles in angles[i]."""
+    for i in prange(angles.shape[0]):
+        qx, qy, qz, qw = _euler_to_quat_scalar(angles[i, 0], angles[i, 1], angles[i, 2])
+        out[i, 0] = qx
+        out[i, 1] = qy
+        out[i, 2] = qz
+        out[i, 3] = qw
+
+
+if njit is not None:
+    _euler_to_quat_scalar = njit(cache=True, fastmath=True)(_euler_to_quat_scalar)
+    _euler_to_quat_rows = njit(cache=True, fastmath=True, parallel=True)(_euler_to_quat_rows)
+
+
+@functools.lru_cache(maxsize=256)
+def _euler_quat_cached(x, y, z):
+    """Memoized _euler_to_quat_scalar for the snapped angles common in scenes."""
+    return _euler_to_quat_scalar(x, y, z)
+
+
+def _euler_to_quat_numpy(angles, out):
+    """Vectorized numpy equivalent of _euler_to_quat_rows for when numba is missing."""
+    half = angles * _HALF_DEG2RAD
+    c = np.cos(half)
+    s = np.sin(half)
+    c1, c2, c3 = c[:, 0], c[:, 1], c[:, 2]
+    s1, s2, s3 = s[:, 0], s[:, 1], s[:, 2]
+    out[:, 0] = s1 * c2 * c3 + c1 * s2 * s3
+    out[:, 1] = c1 * s2 * c3 - s1 * c2 * s3
+    out[:, 2] = c1 * c2 * s3 + s1 * s2 * c3
+    out[:, 3] = c1 * c2 * c3 - s1 * s2 * s3
 
 
 def euler_to_quaternion(euler: Vector3Type) -> Dict[str, float]:
@@ -216,26 +539,259 @@ def euler_to_quaternion(euler: Vector3Type) -> Dict[str, float]:
     # First convert the euler input to a standard format
     euler_dict = convert_vector3(euler, "EulerAngles")
     
-    # Convert degrees to radians
-    x = math.radians(euler_dict["x"])
-    y = math.radians(euler_dict["y"])
-    z = math.radians(euler_dict["z"])
+    qx, qy, qz, qw = _euler_quat_cached(euler_dict["x"], euler_dict["y"], euler_dict["z"])
+    return {"x": qx, "y": qy, "z": qz, "w": qw}
+
+
+def euler_to_quaternion_batch(eulers, dtype=None) -> "np.ndarray":
+    """Convert many Euler angle triples (in degrees) to quaternions at once.
     
-    # Calculate quaternion components
-    c1 = math.cos(x / 2)
-    s1 = math.sin(x / 2)
-    c2 = math.cos(y / 2)
-    s2 = math.sin(y / 2)
-    c3 = math.cos(z / 2)
-    s3 = math.sin(z / 2)
+    Uses a parallel numba kernel when numba is installed and vectorized
+    numpy operations otherwise.
     
-    # Multiply the matrices
-    qx = s1 * c2 * c3 + c1 * s2 * s3
-    qy = c1 * s2 * c3 - s1 * c2 * s3
-    qz = c1 * c2 * s3 + s1 * s2 * c3
-    qw = c1 * c2 * c3 - s1 * s2 * s3
+    Args:
+        eulers: Array-like of shape (N, 3) holding Euler angles in degrees
+        dtype: numpy dtype of the result (defaults to float32, Unity's precision)
+        
+    Returns:
+        numpy array of shape (N, 4) with quaternion components (x, y, z, w) per row
+        
+    Raises:
+        ImportError: If numpy is not installed
+        ParameterValidationError: If eulers does not have shape (N, 3)
+    """
+    if np is None:
+        raise ImportError("euler_to_quaternion_batch requires numpy")
     
-    return {"x": qx, "y": qy, "z": qz, "w": qw}
+    angles = np.ascontiguousarray(eulers, dtype=np.float64)
+    if angles.ndim != 2 or angles.shape[1] != 3:
+        raise ParameterValidationError(
+            f"Invalid EulerAngles batch: expected shape (N, 3), got {angles.shape}"
+        )
+    
+    # Angles are converted in float64; only the stored result is narrowed
+    out = np.empty((angles.shape[0], 4), dtype=np.float32 if dtype is None else dtype)
+    if njit is not None:
+        _euler_to_quat_rows(angles, out)
+    else:
+        _euler_to_quat_numpy(angles, out)
+    return out
+
+
+def quaternion_to_matrix_batch(quats, dtype=None) -> "np.ndarray":
+    """Convert many quaternions to 3x3 rotation matrices at once.
+
+    The products of the quaternion components are computed once per row and
+    shared between the matrix entries, all as vectorized numpy operations.
+
+    Args:
+        quats: Array-like of shape (N, 4) holding quaternion components (x, y, z, w)
+        dtype: numpy dtype of the result (defaults to float32, Unity's precision)
+
+    Returns:
+        numpy array of shape (N, 3, 3) with one rotation matrix per quaternion
+
+    Raises:
+        ImportError: If numpy is not installed
+        ParameterValidationError: If quats does not have shape (N, 4)
+    """
+    if np is None:
+        raise ImportError("quaternion_to_matrix_batch requires numpy")
+
+    q = np.asarray(quats, dtype=np.float64)
+    if q.ndim != 2 or q.shape[1] != 4:
+        raise ParameterValidationError(
+            f"Invalid Quaternion batch: expected shape (N, 4), got {q.shape}"
+        )
+
+    x, y, z, w = q[:, 0], q[:, 1], q[:, 2], q[:, 3]
+    xx, yy, zz = x * x, y * y, z * z
+    xy, xz, yz = x * y, x * z, y * z
+    wx, wy, wz = w * x, w * y, w * z
+
+    # As with euler_to_quaternion_batch, only the stored result is narrowed
+    out = np.empty((q.shape[0], 3, 3), dtype=np.float32 if dtype is None else dtype)
+    out[:, 0, 0] = 1.0 - 2.0 * (yy + zz)
+    out[:, 0, 1] = 2.0 * (xy - wz)
+    out[:, 0, 2] = 2.0 * (xz + wy)
+    out[:, 1, 0] = 2.0 * (xy + wz)
+    out[:, 1, 1] = 1.0 - 2.0 * (xx + zz)
+    out[:, 1, 2] = 2.0 * (yz - wx)
+    out[:, 2, 0] = 2.0 * (xz - wy)
+    out[:, 2, 1] = 2.0 * (yz + wx)
+    out[:, 2, 2] = 1.0 - 2.0 * (xx + yy)
+    return out
+
+
+def _color_result(r: float, g: float, b: float, a: float, param_name: str) -> Dict[str, float]:
+    """Range-check converted color components and build the result dict."""
+    # Validate ranges (0-1) in one expression; find the offender only on failure
+    if not (0.0 <= r <= 1.0 and 0.0 <= g <= 1.0 and 0.0 <= b <= 1.0 and 0.0 <= a <= 1.0):
+        for component, val in (("r", r), ("g", g), ("b", b), ("a", a)):
+            if val < 0 or val > 1:
+                raise ParameterValidationError(
+                    f"Invalid {param_name} value: Color {component} component must be between 0 and 1"
+                )
+    return {"r": r, "g": g, "b": b, "a": a}
+
+
+def _color_from_seq(value, param_name: str) -> Dict[str, float]:
+    """Convert a Color given as a list or tuple."""
+    # Allow RGB (3 components) or RGBA (4 components)
+    if len(value) < 3 or len(value) > 4:
+        raise ParameterValidationError(
+            f"Invalid {param_name} value: Color must have 3 or 4 components, got {len(value)}"
+        )
+    
+    if len(value) == 4:
+        r, g, b, a = value
+    else:
+        r, g, b = value
+        a = 1.0
+    
+    try:
+        r = float(r)
+        g = float(g)
+        b = float(b)
+        a = float(a)
+    except (ValueError, TypeError):
+        raise ParameterValidationError(
+            f"Invalid {param_name} value: Color components must be convertible to float"
+        )
+    return _color_result(r, g, b, a, param_name)
+
+
+def _color_from_dict(value, param_name: str) -> Dict[str, float]:
+    """Convert a Color given as a dict."""
+    # Check if using color formats: exactly r, g, b and optionally a. Direct
+    # membership tests are cheaper than comparing the key view to the key sets
+    size = len(value)
+    if not ("r" in value and "g" in value and "b" in value
+            and (size == 3 or (size == 4 and "a" in value))):
+        raise ParameterValidationError(
+            f"Invalid {param_name} value: Color dict must have keys 'r', 'g', 'b', optional 'a'"
+        )
+    
+    r = value["r"]
+    g = value["g"]
+    b = value["b"]
+    a = value.get("a", 1.0)
+    
+    # An in-range RGBA dict of floats is already canonical and is returned as-is
+    if (type(r) is float and type(g) is float and type(b) is float and type(a) is float
+            and 0.0 <= r <= 1.0 and 0.0 <= g <= 1.0 and 0.0 <= b <= 1.0 and 0.0 <= a <= 1.0):
+        if type(value) is dict and len(value) == 4:
+            return value
+        return {"r": r, "g": g, "b": b, "a": a}
+    
+    try:
+        r = float(r)
+        g = float(g)
+        b = float(b)
+        a = float(a)
+    except (ValueError, TypeError):
+        raise ParameterValidationError(
+            f"Invalid {param_name} value: Color components must be convertible to float"
+        )
+    return _color_result(r, g, b, a, param_name)
+
+
+_COLOR_DISPATCH = {list: _color_from_seq, tuple: _color_from_seq, dict: _color_from_dict}
+
+
+def _quat_to_euler_scalar(qx, qy, qz, qw, i, j, k, extrinsic):
+    """Convert a quaternion to Tait-Bryan angles in radians.
+    
+    Uses the direct method of Bernardes & Viollet (2022), which needs no
+    intermediate rotation matrix and works on non-unit quaternions. i, j, k
+    are the 0-based axes of the extrinsic rotation sequence.
+    """
+    q = (qx, qy, qz)
+    sign = (i - j) * (j - k) * (k - i) // 2
+    
+    a = qw - q[j]
+    b = q[i] + q[k] * sign
+    c = q[j] + qw
+    d = q[k] * sign - q[i]
+    
+    theta2 = 2.0 * math.atan2(math.hypot(c, d), math.hypot(a, b))
+    half_sum = math.atan2(b, a)
+    half_diff = math.atan2(d, c)
+    
+    if abs(theta2) <= 1e-7:
+        # Gimbal lock: only the sum of the outer angles is defined
+        theta1 = 2.0 * half_sum
+        theta3 = 0.0
+    elif abs(theta2 - math.pi) <= 1e-7:
+        # Gimbal lock: only the difference of the outer angles is defined
+        theta1 = -2.0 * half_diff
+        theta3 = 0.0
+    else:
+        theta1 = half_sum - half_diff
+        theta3 = half_sum + half_diff
+    
+    # Tait-Bryan angles are recovered from the proper Euler form
+    theta3 *= sign
+    theta2 -= math.pi / 2
+    
+    if not extrinsic:
+        theta1, theta3 = theta3, theta1
+    
+    # Wrap into [-pi, pi]
+    if theta1 < -math.pi:
+        theta1 += 2.0 * math.pi
+    elif theta1 > math.pi:
+        theta1 -= 2.0 * math.pi
+    if theta3 < -math.pi:
+        theta3 += 2.0 * math.pi
+    elif theta3 > math.pi:
+        theta3 -= 2.0 * math.pi
+    
+    return theta1, theta2, theta3
+
+
+if njit is not None:
+    _quat_to_euler_scalar = njit(cache=True)(_quat_to_euler_scalar)
+
+_AXIS_INDEX = {"x": 0, "y": 1, "z": 2}
+
+
+def quaternion_to_euler(quat: QuaternionType, seq: str = "XYZ", degrees: bool = True) -> Dict[str, float]:
+    """Convert a Quaternion to Euler angles.
+    
+    The default intrinsic "XYZ" sequence is the inverse of euler_to_quaternion.
+    
+    Args:
+        quat: The Quaternion as dict, list, or tuple
+        seq: Rotation sequence of three distinct axes, uppercase for intrinsic
+            rotations (e.g. "XYZ") or lowercase for extrinsic ones (e.g. "zyx")
+        degrees: Return angles in degrees if True, radians otherwise
+        
+    Returns:
+        Euler angles keyed by axis: {"x": float, "y": float, "z": float}
+        
+    Raises:
+        ParameterValidationError: If the quaternion or sequence is invalid
+    """
+    q = convert_quaternion(quat, "Quaternion")
+    
+    axes = seq.lower() if isinstance(seq, str) else ""
+    if (len(axes) != 3 or _AXIS_INDEX.keys() != set(axes)
+            or not (seq.isupper() or seq.islower())):
+        raise ParameterValidationError(
+            f"Invalid rotation sequence '{seq}': expected three distinct axes from 'xyz', all uppercase (intrinsic) or all lowercase (extrinsic)"
+        )
+    
+    extrinsic = seq.islower()
+    # Intrinsic rotations are the extrinsic sequence applied in reverse
+    order = axes if extrinsic else axes[::-1]
+    i, j, k = _AXIS_INDEX[order[0]], _AXIS_INDEX[order[1]], _AXIS_INDEX[order[2]]
+    
+    angles = _quat_to_euler_scalar(q["x"], q["y"], q["z"], q["w"], i, j, k, extrinsic)
+    if degrees:
+        angles = [math.degrees(angle) for angle in angles]
+    
+    return {axis: angle for axis, angle in zip(axes, angles)}
 
 
 def convert_color(value: ColorType, param_name: str = "Color") -> Dict[str, float]:
@@ -251,71 +807,60 @@ def convert_color(value: ColorType, param_name: str = "Color") -> Dict[str, floa
     Raises:
         ParameterValidationError: If validation fails
     """
-    if value is None:
-        raise ParameterValidationError(f"{param_name} cannot be None")
-        
-    error_prefix = f"Invalid {param_name} value"
+    handler = _COLOR_DISPATCH.get(type(value))
+    if handler is None:
+        handler = _resolve_converter(value, param_name, _COLOR_DISPATCH)
+    return handler(value, param_name)
+
+
+def _rect_from_seq(value, param_name: str) -> Dict[str, float]:
+    """Convert a Rect given as a list or tuple."""
+    if len(value) != 4:
+        raise ParameterValidationError(
+            f"Invalid {param_name} value: Rect must have exactly 4 components, got {len(value)}"
+        )
     
-    # Convert list/tuple to dict
-    if isinstance(value, (list, tuple)):
-        # Allow RGB (3 components) or RGBA (4 components)
-        if len(value) < 3 or len(value) > 4:
-            raise ParameterValidationError(
-                f"{error_prefix}: Color must have 3 or 4 components, got {len(value)}"
-            )
-        
-        try:
-            result = {
-                "r": float(value[0]), 
-                "g": float(value[1]), 
-                "b": float(value[2]),
-                "a": float(value[3]) if len(value) > 3 else 1.0
-            }
-            # Validate ranges (0-1)
-            for component, val in result.items():
-                if val < 0 or val > 1:
-                    raise ParameterValidationError(
-                        f"{error_prefix}: Color {component} component must be between 0 and 1"
-                    )
-            return result
-        except (ValueError, TypeError):
-            raise ParameterValidationError(
-                f"{error_prefix}: Color components must be convertible to float"
-            )
-                
-    # Validate and standardize dict format
-    elif isinstance(value, dict):
-        # Check if using color formats
-        if set(value.keys()) == {"r", "g", "b"} or set(value.keys()) == {"r", "g", "b", "a"}:
-            # RGBA format
-            try:
-                result = {
-                    "r": float(value["r"]),
-                    "g": float(value["g"]),
-                    "b": float(value["b"]),
-                    "a": float(value["a"]) if "a" in value else 1.0
-                }
-                # Validate ranges (0-1)
-                for component, val in result.items():
-                    if val < 0 or val > 1:
-                        raise ParameterValidationError(
-                            f"{error_prefix}: Color {component} component must be between 0 and 1"
-                        )
-                return result
-            except (ValueError, TypeError):
-                raise ParameterValidationError(
-                    f"{error_prefix}: Color components must be convertible to float"
-                )
-        else:
-            raise ParameterValidationError(
-                f"{error_prefix}: Color dict must have keys 'r', 'g', 'b', optional 'a'"
-            )
-    else:
+    x, y, width, height = value
+    try:
+        return {"x": float(x), "y": float(y), 
+                "width": float(width), "height": float(height)}
+    except (ValueError, TypeError):
         raise ParameterValidationError(
-            f"{error_prefix}: Expected list, tuple or dict, got {type(value).__name__}"
+            f"Invalid {param_name} value: Rect components must be convertible to float"
         )
 
 
+def _rect_from_dict(value, param_name: str) -> Dict[str, float]:
+    """Convert a Rect given as a dict."""
+    try:
+        x = value["x"]
+        y = value["y"]
+        width = value["width"]
+        height = value["height"]
+    except KeyError:
+        missing_keys = _RECT_KEYS - value.keys()
+        raise ParameterValidationError(
+            f"Invalid {param_name} value: Missing Rect components: {', '.join(missing_keys)}"
+        )
+    
+    if (type(x) is float and type(y) is float
+            and type(width) is float and type(height) is float):
+        if type(value) is dict and len(value) == 4:
+            return value
+        return {"x": x, "y": y, "width": width, "height": height}
+    
+    try:
+        return {"x": float(x), "y": float(y), 
+                "width": float(width), "height": float(height)}
+    except (ValueError, TypeError):
+        raise ParameterValidationError(
+            f"Invalid {param_name} value: Rect components must be convertible to float"
+        )
+
+
+_RECT_DISPATCH = {list: _rect_from_seq, tuple: _rect_from_seq, dict: _rect_from_dict}
+
+
 def convert_rect(value: RectType, param_name: str = "Rect") -> Dict[str, float]:
     """Convert and validate a Rect parameter.
     
@@ -329,46 +874,30 @@ def convert_rect(value: RectType, param_name: str = "Rect") -> Dict[str, float]:
     Raises:
         ParameterValidationError: If validation fails
     """
-    if value is None:
-        raise ParameterValidationError(f"{param_name} cannot be None")
-        
-    error_prefix = f"Invalid {param_name} value"
+    handler = _RECT_DISPATCH.get(type(value))
+    if handler is None:
+        handler = _resolve_converter(value, param_name, _RECT_DISPATCH)
+    return handler(value, param_name)
+
+
+def _fast_vector3(value) -> Dict[str, float]:
+    """Convert a plain dict or 3-item list/tuple to a Vector3 dict.
     
-    # Convert list/tuple to dict
-    if isinstance(value, (list, tuple)):
-        if len(value) != 4:
-            raise ParameterValidationError(
-                f"{error_prefix}: Rect must have exactly 4 components, got {len(value)}"
-            )
-        
-        try:
-            return {"x": float(value[0]), "y": float(value[1]), 
-                    "width": float(value[2]), "height": float(value[3])}
-        except (ValueError, TypeError):
-            raise ParameterValidationError(
-                f"{error_prefix}: Rect components must be convertible to float"
-            )
-                
-    # Validate and standardize dict format
-    elif isinstance(value, dict):
-        required_keys = {"x", "y", "width", "height"}
-        missing_keys = required_keys - set(value.keys())
-        if missing_keys:
-            raise ParameterValidationError(
-                f"{error_prefix}: Missing Rect components: {', '.join(missing_keys)}"
-            )
-            
-        try:
-            return {"x": float(value["x"]), "y": float(value["y"]), 
-                    "width": float(value["width"]), "height": float(value["height"])}
-        except (ValueError, TypeError):
-            raise ParameterValidationError(
-                f"{error_prefix}: Rect components must be convertible to float"
-            )
-    else:
-        raise ParameterValidationError(
-            f"{error_prefix}: Expected list, tuple or dict, got {type(value).__name__}"
-        )
+    Skips the error reporting of convert_vector3; raises KeyError, IndexError,
+    ValueError or TypeError for anything it cannot convert directly. Like
+    convert_vector3, an already-canonical dict is returned as-is.
+    """
+    value_type = type(value)
+    if value_type is dict:
+        x = value["x"]
+        y = value["y"]
+        z = value["z"]
+        if type(x) is float and type(y) is float and type(z) is float and len(value) == 3:
+            return value
+        return {"x": float(x), "y": float(y), "z": float(z)}
+    if (value_type is list or value_type is tuple) and len(value) == 3:
+        return {"x": float(value[0]), "y": float(value[1]), "z": float(value[2])}
+    raise TypeError(f"Cannot convert {value_type.__name__} to Vector3")
 
 
 def convert_bounds(value: BoundsType, param_name: str = "Bounds") -> Dict[str, Dict[str, float]]:
@@ -386,32 +915,175 @@ def convert_bounds(value: BoundsType, param_name: str = "Bounds") -> Dict[str, D
     """
     if value is None:
         raise ParameterValidationError(f"{param_name} cannot be None")
-        
-    error_prefix = f"Invalid {param_name} value"
     
     if not isinstance(value, dict):
         raise ParameterValidationError(
-            f"{error_prefix}: Expected dict, got {type(value).__name__}"
+            f"Invalid {param_name} value: Expected dict, got {type(value).__name__}"
         )
     
-    required_keys = {"center", "size"}
-    missing_keys = required_keys - set(value.keys())
+    try:
+        center = value["center"]
+        size = value["size"]
+        center_dict = _fast_vector3(center)
+        size_dict = _fast_vector3(size)
+    except (KeyError, IndexError, ValueError, TypeError):
+        pass
+    else:
+        # Bounds that are already canonical all the way down are returned as-is
+        if center_dict is center and size_dict is size and type(value) is dict and len(value) == 2:
+            return value
+        return {"center": center_dict, "size": size_dict}
+    
+    # The fast path failed; go through the full checks to report the precise error
+    missing_keys = _BOUNDS_KEYS - value.keys()
     if missing_keys:
         raise ParameterValidationError(
-            f"{error_prefix}: Missing Bounds components: {', '.join(missing_keys)}"
+            f"Invalid {param_name} value: Missing Bounds components: {', '.join(missing_keys)}"
         )
     
-    # Convert and validate the center and size as Vector3
+    # Convert and validate the center and size as Vector3; convert_vector3
+    # reports every bad input as a ParameterValidationError itself
+    center = convert_vector3(value["center"], f"{param_name}.center")
+    size = convert_vector3(value["size"], f"{param_name}.size")
+    return {"center": center, "size": size}
+
+
+def _batch_array(values, width: int, label: str, param_name: str) -> "np.ndarray":
+    """Convert and validate an (N, width) array-like in a single numpy call."""
+    if np is None:
+        raise ImportError(f"Batch {label} conversion requires numpy")
+    
     try:
-        center = convert_vector3(value["center"], f"{param_name}.center")
-        size = convert_vector3(value["size"], f"{param_name}.size")
-        return {"center": center, "size": size}
-    except ParameterValidationError as e:
-        raise e
-    except Exception as e:
+        array = np.asarray(values, dtype=np.float64)
+    except (ValueError, TypeError) as e:
+        raise ParameterValidationError(
+            f"Invalid {param_name} value: {label} components must be convertible to float: {str(e)}"
+        )
+    
+    if array.ndim != 2 or array.shape[1] != width:
+        raise ParameterValidationError(
+            f"Invalid {param_name} value: expected shape (N, {width}), got {array.shape}"
+        )
+    if not np.isfinite(array).all():
+        raise ParameterValidationError(
+            f"Invalid {param_name} value: {label} components must be finite"
+        )
+    return array
+
+
+def convert_vector2_batch(values, param_name: str = "Vector2") -> List[Dict[str, float]]:
+    """Convert and validate many Vector2 values at once.
+    
+    Args:
+        values: Array-like of shape (N, 2)
+        param_name: Name of the parameter for error reporting
+        
+    Returns:
+        List of N dictionaries in the convert_vector2 format
+        
+    Raises:
+        ImportError: If numpy is not installed
+        ParameterValidationError: If validation fails
+    """
+    return [{"x": x, "y": y} for x, y in _batch_array(values, 2, "Vector2", param_name).tolist()]
+
+
+def convert_vector3_batch(values, param_name: str = "Vector3") -> List[Dict[str, float]]:
+    """Convert and validate many Vector3 values at once.
+    
+    Args:
+        values: Array-like of shape (N, 3)
+        param_name: Name of the parameter for error reporting
+        
+    Returns:
+        List of N dictionaries in the convert_vector3 format
+        
+    Raises:
+        ImportError: If numpy is not installed
+        ParameterValidationError: If validation fails
+    """
+    return [{"x": x, "y": y, "z": z} for x, y, z in _batch_array(values, 3, "Vector3", param_name).tolist()]
+
+
+def convert_quaternion_batch(values, param_name: str = "Quaternion") -> List[Dict[str, float]]:
+    """Convert and validate many Quaternion values at once.
+    
+    Args:
+        values: Array-like of shape (N, 4)
+        param_name: Name of the parameter for error reporting
+        
+    Returns:
+        List of N dictionaries in the convert_quaternion format
+        
+    Raises:
+        ImportError: If numpy is not installed
+        ParameterValidationError: If validation fails
+    """
+    return [
+        {"x": x, "y": y, "z": z, "w": w}
+        for x, y, z, w in _batch_array(values, 4, "Quaternion", param_name).tolist()
+    ]
+
+
+def convert_color_batch(values, param_name: str = "Color") -> List[Dict[str, float]]:
+    """Convert and validate many RGBA Color values at once.
+    
+    Args:
+        values: Array-like of shape (N, 4) with components between 0 and 1
+        param_name: Name of the parameter for error reporting
+        
+    Returns:
+        List of N dictionaries in the convert_color format
+        
+    Raises:
+        ImportError: If numpy is not installed
+        ParameterValidationError: If validation fails
+    """
+    array = _batch_array(values, 4, "Color", param_name)
+    if not ((array >= 0.0) & (array <= 1.0)).all():
         raise ParameterValidationError(
-            f"{error_prefix}: {str(e)}"
+            f"Invalid {param_name} value: Color components must be between 0 and 1"
         )
+    # tolist() yields plain Python floats without per-element numpy scalars
+    return [{"r": r, "g": g, "b": b, "a": a} for r, g, b, a in array.tolist()]
+
+
+def convert_rect_batch(values, param_name: str = "Rect") -> List[Dict[str, float]]:
+    """Convert and validate many Rect values at once.
+    
+    Args:
+        values: Array-like of shape (N, 4) holding x, y, width, height
+        param_name: Name of the parameter for error reporting
+        
+    Returns:
+        List of N dictionaries in the convert_rect format
+        
+    Raises:
+        ImportError: If numpy is not installed
+        ParameterValidationError: If validation fails
+    """
+    return [
+        {"x": x, "y": y, "width": w, "height": h}
+        for x, y, w, h in _batch_array(values, 4, "Rect", param_name).tolist()
+    ]
+
+@functools.lru_cache(maxsize=1024)
+def _split_property_path(property_path: str) -> Tuple[str, ...]:
+    """Split a dotted property path into interned parts, caching the result."""
+    return tuple(sys.intern(part) for part in property_path.split('.'))
+
+def _get_by_parts(obj, parts):
+    """Walk a serialized object along pre-split property path parts."""
+    # Pay for the checks only when a hop fails; non-dict values (lists,
+    # strings, numbers) raise TypeError for a string key
+    current = obj
+    try:
+        for part in parts:
+            current = current[part]
+    except (KeyError, TypeError):
+        return None
+            
+    return current
 
 def get_serialized_value(obj, property_path=None):
     """Get a value from a serialized object using dot notation property path.
@@ -425,17 +1097,12 @@ def get_serialized_value(obj, property_path=None):
     """
     if not isinstance(obj, dict) or not property_path:
         return obj
-        
-    parts = property_path.split('.')
-    current = obj
     
-    for part in parts:
-        if isinstance(current, dict) and part in current:
-            current = current[part]
-        else:
-            return None
-            
-    return current
+    # Plain keys need neither splitting nor the path cache
+    if '.' not in property_path:
+        return obj.get(property_path)
+        
+    return _get_by_parts(obj, _split_property_path(property_path))
 
 def is_serialized_unity_object(obj):
     """Check if an object is a serialized Unity object with enhanced metadata.
@@ -446,13 +1113,10 @@ def is_serialized_unity_object(obj):
     Returns:
         True if the object is a serialized Unity object, False otherwise
     """
-    if not isinstance(obj, dict):
-        return False
-        
-    # Check for serialization metadata keys that indicate enhanced serialization
-    return (SERIALIZATION_TYPE_KEY in obj or 
-            SERIALIZATION_UNITY_TYPE_KEY in obj or 
-            SERIALIZATION_STATUS_KEY in obj)
+    # Check for serialization metadata keys that indicate enhanced serialization.
+    # keys().isdisjoint() probes the small marker set against the dict rather
+    # than iterating every key of the object.
+    return isinstance(obj, dict) and not obj.keys().isdisjoint(_META_MARKERS)
 
 def extract_type_info(obj):
     """Extract type information from a serialized Unity object.
@@ -472,7 +1136,7 @@ def extract_type_info(obj):
     if SERIALIZATION_TYPE_KEY in obj:
         full_type = obj[SERIALIZATION_TYPE_KEY]
         # Store the short name (without namespace) for 'type'
-        type_info['type'] = full_type.split('.')[-1] if '.' in full_type else full_type
+        type_info['type'] = full_type.rpartition('.')[2]
         # Store the full type name including namespace for 'unity_type'
         if '.' in full_type:
             type_info['unity_type'] = full_type
@@ -483,7 +1147,7 @@ def extract_type_info(obj):
     elif SERIALIZATION_UNITY_TYPE_KEY in obj:
         full_type = obj[SERIALIZATION_UNITY_TYPE_KEY]
         # Store the short name (without namespace) for 'type'
-        type_info['type'] = full_type.split('.')[-1] if '.' in full_type else full_type
+        type_info['type'] = full_type.rpartition('.')[2]
         # Store the full type name including namespace for 'unity_type'
         type_info['unity_type'] = full_type
         
@@ -494,7 +1158,7 @@ def extract_type_info(obj):
         # Check for type info in introspected properties
         if SERIALIZATION_TYPE_KEY in introspected and 'type' not in type_info:
             full_type = introspected[SERIALIZATION_TYPE_KEY]
-            type_info['type'] = full_type.split('.')[-1] if '.' in full_type else full_type
+            type_info['type'] = full_type.rpartition('.')[2]
             
         if SERIALIZATION_UNITY_TYPE_KEY in introspected and 'unity_type' not in type_info:
             type_info['unity_type'] = introspected[SERIALIZATION_UNITY_TYPE_KEY]
@@ -505,7 +1169,7 @@ def extract_type_info(obj):
         
         # Set 'type' if not already set - just the short name
         if 'type' not in type_info:
-            type_info['type'] = full_type.split('.')[-1] if '.' in full_type else full_type
+            type_info['type'] = full_type.rpartition('.')[2]
             
         # Set 'unity_type' if not already set - full namespace
         if 'unity_type' not in type_info:
@@ -542,37 +1206,36 @@ def get_unity_components(serialized_gameobject):
     Returns:
         List of component objects, or empty list if none found
     """
-    logger = logging.getLogger(__name__)
-    
-    # Debug logging
-    logger.info(f"Looking for components in: {serialized_gameobject.keys() if isinstance(serialized_gameobject, dict) else 'Not a dict'}")
-    
     if not is_serialized_unity_object(serialized_gameobject):
-        logger.info(f"Not a serialized Unity object: {serialized_gameobject.get('__type') if isinstance(serialized_gameobject, dict) else 'N/A'}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Not a serialized Unity object: {serialized_gameobject.get('__type') if isinstance(serialized_gameobject, dict) else 'N/A'}")
         return []
         
+    return _get_components(serialized_gameobject)
+
+def _get_components(serialized_gameobject):
+    """Get the components of an object already known to be a serialized Unity object."""
     # Try to get components from the enhanced serialization format
     if SERIALIZATION_COMPONENTS_KEY in serialized_gameobject:
-        logger.info(f"Found components in {SERIALIZATION_COMPONENTS_KEY}")
         return serialized_gameobject[SERIALIZATION_COMPONENTS_KEY]
     
     # Also check for 'components' key (without the __ prefix)
     if 'components' in serialized_gameobject and isinstance(serialized_gameobject['components'], list):
         comps = serialized_gameobject['components']
-        logger.info(f"Found components in 'components', count: {len(comps)}")
-        for i, comp in enumerate(comps):
-            logger.info(f"Component {i}: {comp.get('__type') if isinstance(comp, dict) else 'Not a dict'}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Found components in 'components', count: {len(comps)}")
+            for i, comp in enumerate(comps):
+                logger.debug(f"Component {i}: {comp.get('__type') if isinstance(comp, dict) else 'Not a dict'}")
         return comps
         
     # Fallback to older format or custom objects
     components = []
     for key, value in serialized_gameobject.items():
-        if (isinstance(value, dict) and 
-            is_serialized_unity_object(value) and 
-            key != SERIALIZATION_CHILDREN_KEY):
+        # is_serialized_unity_object already rejects non-dict values
+        if key != SERIALIZATION_CHILDREN_KEY and is_serialized_unity_object(value):
             components.append(value)
             
-    logger.info(f"Found {len(components)} components via fallback")
+    logger.debug("Found %d components via fallback", len(components))
     return components
 
 def get_unity_children(serialized_gameobject):
@@ -584,27 +1247,22 @@ def get_unity_children(serialized_gameobject):
     Returns:
         List of child GameObjects, or empty list if none found
     """
-    logger = logging.getLogger(__name__)
-    
     if not is_serialized_unity_object(serialized_gameobject):
         return []
-    
-    # Log all keys for debugging
-    logger.info(f"Looking for children in keys: {serialized_gameobject.keys()}")
         
     # Try to get children from the enhanced serialization format
     if SERIALIZATION_CHILDREN_KEY in serialized_gameobject:
-        logger.info(f"Found children in {SERIALIZATION_CHILDREN_KEY}")
         return serialized_gameobject[SERIALIZATION_CHILDREN_KEY]
     
     # Check for 'children' key (without the __ prefix)
     if 'children' in serialized_gameobject and isinstance(serialized_gameobject['children'], list):
-        logger.info(f"Found children in 'children' key, count: {len(serialized_gameobject['children'])}")
+        logger.debug("Found children in 'children' key, count: %d", len(serialized_gameobject['children']))
         return serialized_gameobject['children']
     
     # Check if we have childCount but no children, which might indicate that serialization depth is too low
     if 'childCount' in serialized_gameobject and serialized_gameobject['childCount'] > 0:
-        logger.info(f"Found childCount = {serialized_gameobject['childCount']} but no children array, likely due to serialization depth")
+        logger.info("Found childCount = %s but no children array, likely due to serialization depth",
+                    serialized_gameobject['childCount'])
     
     return []
 
@@ -618,16 +1276,23 @@ def find_component_by_type(serialized_gameobject, component_type):
     Returns:
         The component object, or None if not found
     """
-    logger = logging.getLogger(__name__)
-    
-    logger.info(f"Looking for component of type: {component_type}")
-    
     if not is_serialized_unity_object(serialized_gameobject) or not component_type:
-        logger.info("GameObject is not a serialized unity object or component_type is empty")
+        logger.debug("GameObject is not a serialized unity object or component_type is empty")
         return None
         
-    components = get_unity_components(serialized_gameobject)
-    logger.info(f"Found {len(components)} components")
+    return _find_component(serialized_gameobject, component_type)
+
+def _find_component(serialized_gameobject, component_type):
+    """find_component_by_type for an object already known to be a serialized Unity object."""
+    components = _get_components(serialized_gameobject)
+    
+    # Per-component traces are only formatted when debug logging is on
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        logger.debug(f"Looking for component of type {component_type} in {len(components)} components")
+    
+    # Namespaced type names match on this suffix (e.g. "UnityEngine.Transform")
+    suffix = f".{component_type}"
     
     for i, component in enumerate(components):
         # Check component type information
@@ -636,28 +1301,28 @@ def find_component_by_type(serialized_gameobject, component_type):
         # First check for unity_type
         if SERIALIZATION_UNITY_TYPE_KEY in component:
             type_name = component[SERIALIZATION_UNITY_TYPE_KEY]
-            logger.info(f"Component {i} has unity_type: {type_name}")
+            if debug:
+                logger.debug(f"Component {i} has unity_type: {type_name}")
         
         # If not found, try regular type field
         if not type_name and SERIALIZATION_TYPE_KEY in component:
             type_name = component[SERIALIZATION_TYPE_KEY]
-            logger.info(f"Component {i} has type: {type_name}")
+            if debug:
+                logger.debug(f"Component {i} has type: {type_name}")
         
         # If we have a type name, check for matches
         if type_name:
             # Check for exact type match
             if type_name == component_type:
-                logger.info(f"Found exact match for {component_type}")
                 return component
                 
             # Check if the type name ends with the component type
             # This handles namespace prefixes (e.g., "UnityEngine.Transform" matches "Transform")
-            if type_name.endswith(f".{component_type}") or type_name == component_type:
-                logger.info(f"Found match with namespace: {type_name} for {component_type}")
+            if type_name.endswith(suffix):
                 return component
     
     # If we got here, we didn't find the component
-    logger.info(f"No component of type {component_type} found")
+    logger.debug("No component of type %s found", component_type)
     return None
 
 def is_circular_reference(obj):
@@ -669,10 +1334,7 @@ def is_circular_reference(obj):
     Returns:
         True if the object is a circular reference, False otherwise
     """
-    if not isinstance(obj, dict):
-        return False
-        
-    return obj.get(SERIALIZATION_CIRCULAR_REF_KEY, False) is True
+    return isinstance(obj, dict) and obj.get(SERIALIZATION_CIRCULAR_REF_KEY) is True
 
 def get_reference_path(obj):
     """Get the reference path for a circular reference.
@@ -683,10 +1345,10 @@ def get_reference_path(obj):
     Returns:
         The reference path string, or None if not a circular reference
     """
-    if not is_circular_reference(obj):
-        return None
-        
-    return obj.get(SERIALIZATION_REF_PATH_KEY)
+    # Same check as is_circular_reference, inlined to save a call per lookup
+    if isinstance(obj, dict) and obj.get(SERIALIZATION_CIRCULAR_REF_KEY) is True:
+        return obj.get(SERIALIZATION_REF_PATH_KEY)
+    return None
 
 def get_serialization_depth(obj):
     """Get the serialization depth of a serialized object.
@@ -697,8 +1359,6 @@ def get_serialization_depth(obj):
     Returns:
         The serialization depth string (Basic, Standard, Deep), or None if not specified
     """
-    logger = logging.getLogger(__name__)
-    
     if not is_serialized_unity_object(obj):
         return None
     
@@ -707,11 +1367,16 @@ def get_serialization_depth(obj):
         return obj.get(SERIALIZATION_DEPTH_KEY)
     
     # If not explicitly specified, infer from contents
-    if 'children' in obj and isinstance(obj['children'], list) and len(obj['children']) > 0:
+    children = obj.get('children')
+    if isinstance(children, list) and children:
         # Objects with children are at least Standard depth
-        for child in obj['children']:
-            # If children have components field, it's likely Deep
-            if 'components' in child and isinstance(child['components'], list) and len(child['components']) > 0:
+        for child in children:
+            # If children have components field, it's likely Deep; partial
+            # serializations can leave non-dict placeholders in the list
+            if not isinstance(child, dict):
+                continue
+            components = child.get('components')
+            if isinstance(components, list) and components:
                 logger.debug("Inferred serialization depth: Deep (children have components)")
                 return SERIALIZATION_DEPTH_DEEP
         
@@ -720,7 +1385,7 @@ def get_serialization_depth(obj):
     
     # If it doesn't have the expected depth indicators, check for minimal info
     # Minimal info would indicate Basic depth
-    if 'components' not in obj and 'children' not in obj and '__components' not in obj and '__children' not in obj:
+    if obj.keys().isdisjoint(_DEPTH_MARKERS):
         # Very minimal info, likely Basic depth
         logger.debug("Inferred serialization depth: Basic (minimal info)")
         return SERIALIZATION_DEPTH_BASIC
@@ -729,6 +1394,49 @@ def get_serialization_depth(obj):
     logger.debug("Defaulting to Standard serialization depth")
     return SERIALIZATION_DEPTH_STANDARD
 
+def _vec3_raw(value):
+    """Build a Vec3 from a dict already known to have x, y and z keys."""
+    try:
+        return Vec3(float(value["x"]), float(value["y"]), float(value["z"]))
+    except (ValueError, TypeError):
+        # Let the full converter report the invalid component
+        return Vec3.from_value(value)
+
+def _quat_raw(value):
+    """Build a Quat from a dict already known to have x, y, z and w keys."""
+    try:
+        return Quat(float(value["x"]), float(value["y"]), float(value["z"]), float(value["w"]))
+    except (ValueError, TypeError):
+        return Quat.from_value(value)
+
+# Unity applies Euler angles about Z, then X, then Y (world axes), which is
+# the extrinsic "zxy" sequence, i.e. Quaternion.Euler(x, y, z) = qy * qx * qz
+_UNITY_EULER_SEQ = "zxy"
+
+def _unity_euler_to_quat(x, y, z):
+    """Convert Unity Euler angles in degrees to a Quat, matching Quaternion.Euler."""
+    hx = x * _HALF_DEG2RAD
+    hy = y * _HALF_DEG2RAD
+    hz = z * _HALF_DEG2RAD
+    cx = math.cos(hx)
+    sx = math.sin(hx)
+    cy = math.cos(hy)
+    sy = math.sin(hy)
+    cz = math.cos(hz)
+    sz = math.sin(hz)
+    return Quat(
+        sx * cy * cz + cx * sy * sz,
+        cx * sy * cz - sx * cy * sz,
+        cx * cy * sz - sx * sy * cz,
+        cx * cy * cz + sx * sy * sz,
+    )
+
+def _unity_quat_to_euler(quat):
+    """Convert a Quat to Unity Euler angles in degrees, matching Quaternion.eulerAngles."""
+    euler = quaternion_to_euler((quat.x, quat.y, quat.z, quat.w), _UNITY_EULER_SEQ)
+    # Unity reports angles in [0, 360)
+    return Vec3(euler['x'] % 360.0, euler['y'] % 360.0, euler['z'] % 360.0)
+
 def extract_transform_data(serialized_gameobject):
     """Extract Transform data from a serialized GameObject.
     
@@ -738,29 +1446,128 @@ def extract_transform_data(serialized_gameobject):
     Returns:
         Dict with position, rotation, and scale, or None if not found
     """
-    transform = find_component_by_type(serialized_gameobject, "Transform")
+    if not is_serialized_unity_object(serialized_gameobject):
+        return None
+    
+    # Basic depth carries no components, so there is no Transform to find
+    if serialized_gameobject.get(SERIALIZATION_DEPTH_KEY) == SERIALIZATION_DEPTH_BASIC:
+        return None
+    
+    transform = _find_component(serialized_gameobject, "Transform")
     if not transform:
         return None
         
     result = {}
     
     # Extract position
-    position = get_serialized_value(transform, "position")
-    if isinstance(position, dict) and all(k in position for k in ['x', 'y', 'z']):
-        result['position'] = convert_vector3(position)
+    position = transform.get("position")
+    if isinstance(position, dict) and position.keys() >= _VECTOR3_KEYS:
+        result['position'] = _vec3_raw(position)
         
-    # Extract rotation (could be quaternion or euler angles)
-    rotation = get_serialized_value(transform, "rotation")
-    if isinstance(rotation, dict) and all(k in rotation for k in ['x', 'y', 'z', 'w']):
-        result['rotation'] = convert_quaternion(rotation)
+    # Extract rotation and euler angles as serialized by Unity; only a missing
+    # one is derived from the other, using Unity's ZXY convention
+    rotation = transform.get("rotation")
+    if isinstance(rotation, dict) and rotation.keys() >= _QUATERNION_KEYS:
+        result['rotation'] = _quat_raw(rotation)
     
-    euler = get_serialized_value(transform, "eulerAngles")
-    if not rotation and isinstance(euler, dict) and all(k in euler for k in ['x', 'y', 'z']):
-        result['eulerAngles'] = convert_vector3(euler)
+    euler = transform.get("eulerAngles")
+    if isinstance(euler, dict) and euler.keys() >= _VECTOR3_KEYS:
+        result['eulerAngles'] = _vec3_raw(euler)
+    
+    if 'rotation' in result:
+        if 'eulerAngles' not in result:
+            result['eulerAngles'] = _unity_quat_to_euler(result['rotation'])
+    elif 'eulerAngles' in result:
+        angles = result['eulerAngles']
+        result['rotation'] = _unity_euler_to_quat(angles.x, angles.y, angles.z)
         
     # Extract scale
-    scale = get_serialized_value(transform, "localScale")
-    if isinstance(scale, dict) and all(k in scale for k in ['x', 'y', 'z']):
-        result['scale'] = convert_vector3(scale)
+    scale = transform.get("localScale")
+    if isinstance(scale, dict) and scale.keys() >= _VECTOR3_KEYS:
+        result['scale'] = _vec3_raw(scale)
         
-    return result 
\ No newline at end of file
+    # Typed records are only turned into dicts at the return boundary
+    return {key: value.to_dict() for key, value in result.items()}
+
+
+def _read_components(value, keys):
+    """Read named float components from a serialized dict, NaN where missing or invalid."""
+    if not isinstance(value, dict):
+        return (math.nan,) * len(keys)
+    row = []
+    for key in keys:
+        try:
+            row.append(float(value[key]))
+        except (KeyError, ValueError, TypeError):
+            row.append(math.nan)
+    return row
+
+
+def extract_all_transforms(root, dtype=None) -> Dict[str, Any]:
+    """Extract Transform data for a whole serialized hierarchy into arrays.
+    
+    Walks the hierarchy once in preorder and stores the Transforms as a
+    structure of arrays rather than a dict per GameObject. Rotations given
+    only as eulerAngles are converted to quaternions; missing components are NaN.
+    
+    Args:
+        root: The serialized root GameObject
+        dtype: numpy dtype of the output arrays (defaults to float32, Unity's precision)
+        
+    Returns:
+        Dict with "positions" (N, 3), "rotations" (N, 4, quaternion x/y/z/w) and
+        "scales" (N, 3) arrays, plus "paths", a list of the N GameObject paths
+        
+    Raises:
+        ImportError: If numpy is not installed
+    """
+    if np is None:
+        raise ImportError("extract_all_transforms requires numpy")
+    if dtype is None:
+        dtype = np.float32
+    
+    capacity = 64
+    positions = np.empty((capacity, 3), dtype=dtype)
+    rotations = np.empty((capacity, 4), dtype=dtype)
+    scales = np.empty((capacity, 3), dtype=dtype)
+    paths = []
+    count = 0
+    
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if not is_serialized_unity_object(node) or is_circular_reference(node):
+            continue
+        
+        transform = _find_component(node, "Transform")
+        if transform:
+            if count == capacity:
+                # Grow by doubling
+                capacity *= 2
+                positions = np.resize(positions, (capacity, 3))
+                rotations = np.resize(rotations, (capacity, 4))
+                scales = np.resize(scales, (capacity, 3))
+            
+            positions[count] = _read_components(transform.get("position"), ("x", "y", "z"))
+            rotation = transform.get("rotation")
+            if isinstance(rotation, dict):
+                rotations[count] = _read_components(rotation, ("x", "y", "z", "w"))
+            else:
+                # Same Unity ZXY convention as extract_transform_data
+                x, y, z = _read_components(transform.get("eulerAngles"), ("x", "y", "z"))
+                quat = _unity_euler_to_quat(x, y, z)
+                rotations[count] = (quat.x, quat.y, quat.z, quat.w)
+            scales[count] = _read_components(transform.get("localScale"), ("x", "y", "z"))
+            paths.append(node.get(SERIALIZATION_PATH_KEY) or node.get("name"))
+            count += 1
+        
+        # Push children in reverse so they are visited in order
+        children = get_unity_children(node) or ()
+        stack.extend(reversed(children))
+    
+    return {
+        "positions": positions[:count],
+        "rotations": rotations[:count],
+        "scales": scales[:count],
+        "paths": paths,
+    }
@@ -30,13 +30,12 @@ def is_unity_running(host: str = "localhost", port: int = 6400, timeout: int = 1
     Returns:
         bool: True if Unity is available, False otherwise
     """
+    # socket.timeout and refused connections are both OSErrors; anything else,
+    # such as KeyboardInterrupt, is not swallowed
     try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(timeout)
-        sock.connect((host, port))
-        sock.close()
-        return True
-    except:
+        with socket.create_connection((host, port), timeout=timeout):
+            return True
+    except OSError:
         return False
 
 def retry_test(max_retries: int = None, retry_delay: float = None):
@@ -59,33 +58,29 @@ def retry_test(max_retries: int = None, retry_delay: float = None):
         retry_delay = config.retry_delay
     
     def decorator(func):
+        # With retries disabled there is nothing to wrap
+        if max_retries <= 0:
+            return func
+
+        # The backoff schedule is fixed, so work it out once per decorated test
+        delays = tuple(retry_delay * (2 ** i) for i in range(max_retries))
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            last_exception = None
-            current_delay = retry_delay
-            
-            for retry_count in range(max_retries + 1):
+            for retry_count, delay in enumerate(delays, 1):
                 try:
                     return func(*args, **kwargs)
                 except (ConnectionError, socket.error) as e:
-                    last_exception = e
-                    if retry_count < max_retries:
-                        logger.warning(f"Test {func.__name__} failed with connection error. "
-                                      f"Retry {retry_count + 1}/{max_retries} in {current_delay:.2f}s: {str(e)}")
-                        time.sleep(current_delay)
-                        current_delay *= 2  # Exponential backoff
-                    else:
-                        logger.error(f"Test {func.__name__} failed after {max_retries} retries: {str(e)}")
-                        raise
-                except Exception as e:
-                    # For non-connection errors, don't retry
-                    raise
+                    logger.warning(f"Test {func.__name__} failed with connection error. "
+                                  f"Retry {retry_count}/{max_retries} in {delay:.2f}s: {str(e)}")
+                    time.sleep(delay)
             
-            # This should never be reached
-            if last_exception:
-                raise last_exception
-            else:
-                raise RuntimeError(f"Test {func.__name__} failed for unknown reason")
+            # Final attempt; non-connection errors are never retried
+            try:
+                return func(*args, **kwargs)
+            except (ConnectionError, socket.error) as e:
+                logger.error(f"Test {func.__name__} failed after {max_retries} retries: {str(e)}")
+                raise
         
         return wrapper
     
@@ -102,24 +97,8 @@ def unity_conn():
     Returns:
         UnityConnection: A connection to the Unity Editor
     """
-    # Verify that Unity is running before trying to connect
-    retry_count = 0
-    max_retries = config.max_retries
-    retry_delay = config.retry_delay
-    
-    while retry_count <= max_retries:
-        if is_unity_running():
-            break
-            
-        if retry_count < max_retries:
-            retry_count += 1
-            logger.warning(f"Unity Editor not detected. Retry {retry_count}/{max_retries} in {retry_delay:.2f}s")
-            time.sleep(retry_delay)
-            retry_delay *= 2  # Exponential backoff
-        else:
-            pytest.skip("Unity Editor is not running after multiple attempts. Start Unity with the MCP Bridge plugin to run these tests.")
-    
-    # Get a real connection to Unity using get_unity_connection which now has its own retry logic
+    # get_unity_connection retries with exponential backoff itself, so no
+    # separate socket probe is made before connecting
     try:
         connection = get_unity_connection()
         
@@ -173,32 +152,28 @@ def cleanup_gameobjects(unity_conn):
         
         # Check if we got a valid response
         if isinstance(result, dict) and "data" in result:
-            gameobjects = result.get("data", [])
-            test_objects_to_delete = []
+            gameobjects = result["data"]
             
             # Make sure gameObjects is a list
             if isinstance(gameobjects, list):
-                # First, identify all test objects (those starting with "Test")
-                for go in gameobjects:
-                    if isinstance(go, dict) and "name" in go:
-                        go_name = go.get("name", "")
-                        # Check if the name starts with "Test"
-                        if go_name and go_name.startswith("Test"):
-                            test_objects_to_delete.append(go_name)
+                # First, identify all test objects (those whose name starts with "Test")
+                test_objects_to_delete = [
+                    name for go in gameobjects
+                    if isinstance(go, dict) and (name := go.get("name")) and name.startswith("Test")
+                ]
                 
-                # Then delete them one by one
-                for test_obj_name in test_objects_to_delete:
+                # Then delete them all in one command; the delete action accepts
+                # a list of targets and reports per-target failures itself
+                if test_objects_to_delete:
                     try:
                         unity_conn.send_command("manage_gameobject", {
                             "action": "delete",
-                            "target": test_obj_name
+                            "target": test_objects_to_delete
                         })
-                        logger.info(f"Cleaned up GameObject: {test_obj_name}")
+                        logger.info(f"Cleaned up {len(test_objects_to_delete)} test GameObjects: "
+                                    f"{', '.join(test_objects_to_delete)}")
                     except Exception as e:
-                        logger.warning(f"Error deleting GameObject {test_obj_name}: {str(e)}")
-                
-                if test_objects_to_delete:
-                    logger.info(f"Cleaned up {len(test_objects_to_delete)} test GameObjects")
+                        logger.warning(f"Error deleting GameObjects {test_objects_to_delete}: {str(e)}")
                 else:
                     logger.info("No test GameObjects found for cleanup")
             else:
@@ -32,15 +32,33 @@ import logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("unity-test-runner")
 
+# Seconds a probe result is reused for, keyed by (host, port)
+_PROBE_TTL = 2.0
+_probe_cache = {}
+
 def is_unity_running(host="localhost", port=6400, timeout=1):
-    """Check if Unity is running and available on the given port."""
+    """Check if Unity is running and available on the given port.
+    
+    The result is reused for _PROBE_TTL seconds, so calling run_tests again
+    in-process does not reconnect or wait out the timeout again.
+    """
+    key = (host, port)
+    cached = _probe_cache.get(key)
+    if cached is not None and time.monotonic() - cached[0] < _PROBE_TTL:
+        return cached[1]
+    
+    running = _probe_unity(host, port, timeout)
+    _probe_cache[key] = (time.monotonic(), running)
+    return running
+
+def _probe_unity(host, port, timeout):
+    """Open and close a TCP connection to Unity's port."""
+    # socket.timeout and refused connections are both OSErrors; anything else,
+    # such as KeyboardInterrupt, is not swallowed
     try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(timeout)
-        sock.connect((host, port))
-        sock.close()
-        return True
-    except:
+        with socket.create_connection((host, port), timeout=timeout):
+            return True
+    except OSError:
         return False
 
 def run_tests(test_pattern=None):
@@ -1,9 +1,10 @@
+import asyncio
 import socket
 import json
 import logging
 import sys
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict, is_dataclass
 from typing import Dict, Any, Optional, List, Tuple, Union
 from config import config
 from exceptions import ParameterValidationError, UnityCommandError, ConnectionError
@@ -17,6 +18,36 @@ logging.basicConfig(
 )
 logger = logging.getLogger("unity-mcp-server")
 
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to the stdlib encoder
+    orjson = None
+
+def _json_default(obj: Any) -> Any:
+    """Encode dataclass values (e.g. type_converters.Vec3) and numpy arrays/scalars."""
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize an object to UTF-8 JSON bytes, using orjson when it is installed.
+    
+    Dataclass values such as the typed records from type_converters are
+    encoded as JSON objects, so tools can pass them to Unity without
+    converting them to dicts first. numpy arrays from the batch helpers are
+    encoded as nested lists; orjson writes float32 values in their shortest
+    form, which is all the precision Unity keeps.
+    """
+    if orjson is not None:
+        try:
+            # orjson serializes dataclasses natively
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError:
+            pass  # e.g. integers wider than 64 bits; let the stdlib handle them
+    return json.dumps(obj, ensure_ascii=False, default=_json_default).encode('utf-8')
+
 # Maximum number of retries for sending commands
 MAX_RETRIES = config.max_retries
 # Time to wait between retries
@@ -40,6 +71,11 @@ class UnityConnection:
         self.host = host
         self.port = port
         self.sock = sock or self._connect()
+        # Stream connection used by send_command_async, opened on first use
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._async_lock: Optional[asyncio.Lock] = None
         logger.info(f"Connected to Unity at {host}:{port}")
 
     def _connect(self):
@@ -76,6 +112,47 @@ class UnityConnection:
             finally:
                 self.sock = None
 
+    def _is_complete_response(self, data: bytes) -> bool:
+        """Check whether the bytes received so far form a complete response.
+        
+        Args:
+            data: All bytes received for the current response
+            
+        Returns:
+            bool: True if data holds a complete JSON response
+        """
+        decoded_data = data.decode('utf-8')
+        try:
+            # Special case for ping-pong
+            if decoded_data.strip().startswith('{"status":"success","result":{"message":"pong"'):
+                logger.debug("Received ping response")
+                return True
+            
+            # Handle escaped quotes in the content
+            if '"content":' in decoded_data:
+                # Find the content field and its value
+                content_start = decoded_data.find('"content":') + 9
+                content_end = decoded_data.rfind('"', content_start)
+                if content_end > content_start:
+                    # Replace escaped quotes in content with regular quotes
+                    content = decoded_data[content_start:content_end]
+                    content = content.replace('\\"', '"')
+                    decoded_data = decoded_data[:content_start] + content + decoded_data[content_end:]
+            
+            # Validate JSON format
+            json.loads(decoded_data)
+            
+            # If we get here, we have valid JSON
+            logger.info(f"Received complete response ({len(data)} bytes)")
+            return True
+        except json.JSONDecodeError:
+            # We haven't received a complete valid JSON response yet
+            return False
+        except Exception as e:
+            logger.warning(f"Error processing response chunk: {str(e)}")
+            # Continue reading more chunks as this might not be the complete response
+            return False
+
     def receive_full_response(self, sock, buffer_size=config.buffer_size) -> bytes:
         """Receive a complete response from Unity, handling chunked data."""
         chunks = []
@@ -89,41 +166,10 @@ class UnityConnection:
                     break
                 chunks.append(chunk)
                 
-                # Process the data received so far
-                data = b''.join(chunks)
-                decoded_data = data.decode('utf-8')
-                
                 # Check if we've received a complete response
-                try:
-                    # Special case for ping-pong
-                    if decoded_data.strip().startswith('{"status":"success","result":{"message":"pong"'):
-                        logger.debug("Received ping response")
-                        return data
-                    
-                    # Handle escaped quotes in the content
-                    if '"content":' in decoded_data:
-                        # Find the content field and its value
-                        content_start = decoded_data.find('"content":') + 9
-                        content_end = decoded_data.rfind('"', content_start)
-                        if content_end > content_start:
-                            # Replace escaped quotes in content with regular quotes
-                            content = decoded_data[content_start:content_end]
-                            content = content.replace('\\"', '"')
-                            decoded_data = decoded_data[:content_start] + content + decoded_data[content_end:]
-                    
-                    # Validate JSON format
-                    json.loads(decoded_data)
-                    
-                    # If we get here, we have valid JSON
-                    logger.info(f"Received complete response ({len(data)} bytes)")
+                data = b''.join(chunks)
+                if self._is_complete_response(data):
                     return data
-                except json.JSONDecodeError:
-                    # We haven't received a complete valid JSON response yet
-                    continue
-                except Exception as e:
-                    logger.warning(f"Error processing response chunk: {str(e)}")
-                    # Continue reading more chunks as this might not be the complete response
-                    continue
         except socket.timeout:
             logger.warning("Socket timeout during receive")
             raise ConnectionError("Timeout receiving Unity response")
@@ -131,6 +177,76 @@ class UnityConnection:
             logger.error(f"Error during receive: {str(e)}")
             raise
 
+    def _encode_command(self, command_type: str, params: Dict[str, Any]) -> bytes:
+        """Serialize a command into the bytes sent to Unity.
+        
+        Args:
+            command_type: The type of command to send
+            params: The parameters for the command
+            
+        Returns:
+            bytes: The UTF-8 encoded command payload
+        """
+        # Special handling for ping command
+        if command_type == "ping":
+            logger.debug("Sending ping to verify connection")
+            return b"ping"
+        
+        # Normal command handling
+        command = {"type": command_type, "params": params}
+        
+        # Serialize once; the payload length doubles as the size check
+        command_json = _dumps(command)
+        command_size = len(command_json)
+        
+        # Check for very large content that might cause JSON issues
+        if command_size > config.buffer_size / 2:
+            logger.warning(f"Large command detected ({command_size} bytes). This might cause issues.")
+            
+        logger.info(f"Sending command: {command_type} with params size: {command_size} bytes")
+        
+        return command_json
+
+    def _decode_response(self, command_type: str, response_data: bytes) -> Dict[str, Any]:
+        """Parse a raw Unity response and extract its result.
+        
+        Args:
+            command_type: The type of command the response belongs to
+            response_data: The complete response bytes received from Unity
+            
+        Returns:
+            The result from Unity
+            
+        Raises:
+            ConnectionError: If a ping response was not successful
+            UnityCommandError: If the response is invalid or Unity returned an error
+        """
+        if command_type == "ping":
+            response = json.loads(response_data.decode('utf-8'))
+            
+            if response.get("status") != "success":
+                logger.warning("Ping response was not successful")
+                raise ConnectionError("Connection verification failed")
+                
+            return {"message": "pong"}
+        
+        try:
+            response = json.loads(response_data.decode('utf-8'))
+        except json.JSONDecodeError as je:
+            logger.error(f"JSON decode error: {str(je)}")
+            # Log partial response for debugging
+            partial_response = response_data.decode('utf-8')[:500] + "..." if len(response_data) > 500 else response_data.decode('utf-8')
+            logger.error(f"Partial response: {partial_response}")
+            raise UnityCommandError(f"Invalid JSON response from Unity: {str(je)}")
+        
+        if response.get("status") == "error":
+            error_message = response.get("error") or response.get("message", "Unknown Unity error")
+            logger.error(f"Unity error: {error_message}")
+            raise UnityCommandError(error_message)
+        
+        # Success! Return the result
+        return response.get("result", {})
+
     def send_command(self, command_type: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
         """Send a command to Unity and return its response.
         
@@ -161,52 +277,9 @@ class UnityConnection:
                 if not self.sock and not self.connect():
                     raise ConnectionError("Not connected to Unity")
                 
-                # Special handling for ping command
-                if command_type == "ping":
-                    logger.debug("Sending ping to verify connection")
-                    self.sock.sendall(b"ping")
-                    response_data = self.receive_full_response(self.sock)
-                    response = json.loads(response_data.decode('utf-8'))
-                    
-                    if response.get("status") != "success":
-                        logger.warning("Ping response was not successful")
-                        self.sock = None
-                        raise ConnectionError("Connection verification failed")
-                        
-                    return {"message": "pong"}
-                
-                # Normal command handling
-                command = {"type": command_type, "params": params}
-                
-                # Check for very large content that might cause JSON issues
-                command_size = len(json.dumps(command))
-                
-                if command_size > config.buffer_size / 2:
-                    logger.warning(f"Large command detected ({command_size} bytes). This might cause issues.")
-                    
-                logger.info(f"Sending command: {command_type} with params size: {command_size} bytes")
-                
-                # Ensure we have a valid JSON string before sending
-                command_json = json.dumps(command, ensure_ascii=False)
-                self.sock.sendall(command_json.encode('utf-8'))
-                
+                self.sock.sendall(self._encode_command(command_type, params))
                 response_data = self.receive_full_response(self.sock)
-                try:
-                    response = json.loads(response_data.decode('utf-8'))
-                except json.JSONDecodeError as je:
-                    logger.error(f"JSON decode error: {str(je)}")
-                    # Log partial response for debugging
-                    partial_response = response_data.decode('utf-8')[:500] + "..." if len(response_data) > 500 else response_data.decode('utf-8')
-                    logger.error(f"Partial response: {partial_response}")
-                    raise UnityCommandError(f"Invalid JSON response from Unity: {str(je)}")
-                
-                if response.get("status") == "error":
-                    error_message = response.get("error") or response.get("message", "Unknown Unity error")
-                    logger.error(f"Unity error: {error_message}")
-                    raise UnityCommandError(error_message)
-                
-                # Success! Return the result
-                return response.get("result", {})
+                return self._decode_response(command_type, response_data)
             
             except UnityCommandError:
                 # Don't retry for command errors (these are expected to fail consistently)
@@ -261,6 +334,111 @@ class UnityConnection:
         # This should never be reached due to the raises above, but just in case
         raise ConnectionError(f"Failed to communicate with Unity: Maximum retries exceeded")
 
+    async def _connect_async(self):
+        """Open the stream connection used by send_command_async."""
+        try:
+            self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+            self._async_loop = asyncio.get_running_loop()
+        except OSError as e:
+            raise ConnectionError(f"Failed to connect to Unity at {self.host}:{self.port}: {str(e)}")
+
+    def _reset_async(self):
+        """Drop the stream connection so the next async send reopens it."""
+        if self._writer is not None:
+            try:
+                self._writer.close()
+            except Exception:
+                pass  # Ignore errors closing the stream
+        self._reader = None
+        self._writer = None
+
+    async def _receive_full_response_async(self, buffer_size=config.buffer_size) -> bytes:
+        """Receive a complete response from Unity over the stream connection."""
+        chunks = []
+        while True:
+            try:
+                chunk = await asyncio.wait_for(self._reader.read(buffer_size), config.connection_timeout)
+            except asyncio.TimeoutError:
+                logger.warning("Stream timeout during receive")
+                raise ConnectionError("Timeout receiving Unity response")
+            if not chunk:
+                if not chunks:
+                    raise ConnectionError("Connection closed before receiving data")
+                return b''.join(chunks)
+            chunks.append(chunk)
+            
+            # Check if we've received a complete response
+            data = b''.join(chunks)
+            if self._is_complete_response(data):
+                return data
+
+    async def send_command_async(self, command_type: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Send a command to Unity without blocking the event loop.
+        
+        Uses a dedicated asyncio stream connection, so async callers await the
+        socket directly instead of handing send_command to a worker thread.
+        Retries follow the same exponential backoff as send_command.
+        
+        Args:
+            command_type: The type of command to send
+            params: The parameters for the command
+            
+        Returns:
+            The response from Unity
+            
+        Raises:
+            ConnectionError: If unable to connect to Unity after retries
+            UnityCommandError: If Unity returns an error
+        """
+        # Make sure params is at least an empty dict
+        params = params or {}
+        payload = self._encode_command(command_type, params)
+        
+        # Streams and locks belong to the loop that created them
+        loop = asyncio.get_running_loop()
+        if self._async_loop is not loop:
+            self._reset_async()
+            self._async_loop = loop
+            self._async_lock = asyncio.Lock()
+        
+        retry_count = 0
+        retry_delay = RETRY_WAIT
+        
+        while True:
+            try:
+                # One request/response exchange at a time on the shared stream
+                async with self._async_lock:
+                    try:
+                        if self._writer is None:
+                            await self._connect_async()
+                        self._writer.write(payload)
+                        await self._writer.drain()
+                        response_data = await self._receive_full_response_async()
+                    except BaseException:
+                        # Any interrupted exchange, including cancellation of the
+                        # awaiting task, can leave a reply unread on the stream;
+                        # drop it so the next command cannot read that reply
+                        self._reset_async()
+                        raise
+                return self._decode_response(command_type, response_data)
+            
+            except UnityCommandError:
+                # Don't retry for command errors (these are expected to fail consistently)
+                raise
+                
+            except Exception as e:
+                if retry_count < MAX_RETRIES:
+                    retry_count += 1
+                    logger.warning(f"Communication error with Unity. Retry {retry_count}/{MAX_RETRIES} in {retry_delay:.2f}s: {str(e)}")
+                    
+                    # Sleep with exponential backoff
+                    await asyncio.sleep(retry_delay)
+                    retry_delay *= 2  # Exponential backoff
+                else:
+                    # We've reached max retries
+                    logger.error(f"Failed to communicate with Unity after {MAX_RETRIES} retries: {str(e)}")
+                    raise ConnectionError(f"Failed to communicate with Unity after {MAX_RETRIES} retries: {str(e)}")
+
     def reconnect(self):
         """Reestablish the connection to Unity if it was lost.
         
@@ -18,6 +18,9 @@ from type_converters import (
     SERIALIZATION_PATH_KEY, SERIALIZATION_ID_KEY
 )
 
+# Required keys for the dict form of a Vector3
+_VECTOR3_KEYS = frozenset({"x", "y", "z"})
+
 class ParameterFormat:
     """Base class for parameter format definitions.
     
@@ -231,14 +234,12 @@ def validate_vector3(value: Any, param_name: str) -> None:
     """
     if value is None:
         return  # Optional parameter
-        
-    error_prefix = f"Invalid {param_name} value"
-    
+
     # Check if value is a list or array-like
     if isinstance(value, (list, tuple)):
         if len(value) != 3:
             raise ParameterValidationError(
-                f"{error_prefix}: Vector3 must have exactly 3 components, got {len(value)}. " 
+                f"Invalid {param_name} value: Vector3 must have exactly 3 components, got {len(value)}. " 
                 f"Example format: [x, y, z] with numeric values."
             )
         
@@ -246,30 +247,29 @@ def validate_vector3(value: Any, param_name: str) -> None:
         for i, component in enumerate(value):
             if not isinstance(component, (int, float)):
                 raise ParameterValidationError(
-                    f"{error_prefix}: Component {i} must be a number, got {type(component).__name__} ({component}). "
+                    f"Invalid {param_name} value: Component {i} must be a number, got {type(component).__name__} ({component}). "
                     f"Example format: [0, 1, 0] with all numeric values."
                 )
                 
     # Check if value is a dictionary with x,y,z keys
     elif isinstance(value, dict):
-        required_keys = {"x", "y", "z"}
-        missing_keys = required_keys - set(value.keys())
+        missing_keys = _VECTOR3_KEYS - value.keys()
         if missing_keys:
             raise ParameterValidationError(
-                f"{error_prefix}: Missing Vector3 components: {', '.join(missing_keys)}. "
+                f"Invalid {param_name} value: Missing Vector3 components: {', '.join(missing_keys)}. "
                 f"Example format: {{\"x\": 0, \"y\": 1, \"z\": 0}} with all components."
             )
             
         # Check if values are numbers
-        for key in required_keys:
+        for key in _VECTOR3_KEYS:
             if not isinstance(value[key], (int, float)):
                 raise ParameterValidationError(
-                    f"{error_prefix}: Component {key} must be a number, got {type(value[key]).__name__} ({value[key]}). "
+                    f"Invalid {param_name} value: Component {key} must be a number, got {type(value[key]).__name__} ({value[key]}). "
                     f"Example format: {{\"x\": 0, \"y\": 1, \"z\": 0}} with numeric values."
                 )
     else:
         raise ParameterValidationError(
-            f"{error_prefix}: Expected list, tuple or dict, got {type(value).__name__} ({value}). "
+            f"Invalid {param_name} value: Expected list, tuple or dict, got {type(value).__name__} ({value}). "
             f"Example formats: [0, 1, 0] or {{\"x\": 0, \"y\": 1, \"z\": 0}}"
         )
 
@@ -569,24 +569,22 @@ def validate_serialized_gameobject(value: Any, param_name: str) -> None:
     """
     if value is None:
         return  # Optional parameter
-        
-    error_prefix = f"Invalid {param_name} value"
-    
+
     if not isinstance(value, dict):
         raise ParameterValidationError(
-            f"{error_prefix}: Expected GameObject object, got {type(value).__name__} ({value})"
+            f"Invalid {param_name} value: Expected GameObject object, got {type(value).__name__} ({value})"
         )
         
     if not is_serialized_unity_object(value):
         raise ParameterValidationError(
-            f"{error_prefix}: Value is not a serialized Unity object"
+            f"Invalid {param_name} value: Value is not a serialized Unity object"
         )
     
     # Check for expected GameObject properties
     type_info = extract_type_info(value)
     if not type_info:
         raise ParameterValidationError(
-            f"{error_prefix}: Missing type information for GameObject"
+            f"Invalid {param_name} value: Missing type information for GameObject"
         )
         
     # Check if it's a circular reference (which is valid)
@@ -601,7 +599,7 @@ def validate_serialized_gameobject(value: Any, param_name: str) -> None:
         'GameObject' in unity_type
     ):
         raise ParameterValidationError(
-            f"{error_prefix}: Object is not a GameObject, got {unity_type}"
+            f"Invalid {param_name} value: Object is not a GameObject, got {unity_type}"
         )
 
 def validate_serialized_component(value: Any, param_name: str, required_type: Optional[str] = None) -> None:
@@ -617,24 +615,22 @@ def validate_serialized_component(value: Any, param_name: str, required_type: Op
     """
     if value is None:
         return  # Optional parameter
-        
-    error_prefix = f"Invalid {param_name} value"
-    
+
     if not isinstance(value, dict):
         raise ParameterValidationError(
-            f"{error_prefix}: Expected Component object, got {type(value).__name__} ({value})"
+            f"Invalid {param_name} value: Expected Component object, got {type(value).__name__} ({value})"
         )
         
     if not is_serialized_unity_object(value):
         raise ParameterValidationError(
-            f"{error_prefix}: Value is not a serialized Unity object"
+            f"Invalid {param_name} value: Value is not a serialized Unity object"
         )
     
     # Check for expected Component properties
     type_info = extract_type_info(value)
     if not type_info:
         raise ParameterValidationError(
-            f"{error_prefix}: Missing type information for Component"
+            f"Invalid {param_name} value: Missing type information for Component"
         )
         
     # Check if it's a circular reference (which is valid)
@@ -645,7 +641,7 @@ def validate_serialized_component(value: Any, param_name: str, required_type: Op
     unity_type = type_info.get('unity_type', '')
     if not unity_type:
         raise ParameterValidationError(
-            f"{error_prefix}: Missing component type information"
+            f"Invalid {param_name} value: Missing component type information"
         )
         
     # Validate against required_type if specified
@@ -655,7 +651,7 @@ def validate_serialized_component(value: Any, param_name: str, required_type: Op
         required_type in unity_type
     ):
         raise ParameterValidationError(
-            f"{error_prefix}: Expected component of type {required_type}, got {unity_type}"
+            f"Invalid {param_name} value: Expected component of type {required_type}, got {unity_type}"
         )
 
 def validate_serialized_transform(value: Any, param_name: str) -> None: